@@ -1,34 +1,97 @@
 """Merge individual examples into a batch"""
 
 import logging
-from typing import Sequence, Union
+import os
+from concurrent import futures
+from typing import Optional, Sequence, Union
 
 import numpy as np
+import torch
 from torch.utils.data import IterDataPipe, functional_datapipe
 
 from ocf_datapipes.batch import BatchKey, NumpyBatch, NWPBatchKey, NWPNumpyBatch
 
 logger = logging.getLogger(__name__)
 
+# Only keys with at least this many bytes to copy are stacked on the thread pool. For smaller keys
+# handing the copy to a thread costs more than the copy itself
+_MIN_BYTES_TO_STACK_IN_PARALLEL = 1 << 20
+_STACK_POOL_MAX_WORKERS = 4
+
+_stack_pool = None
+_stack_pool_pid = None
+
+
+def _get_stack_pool() -> futures.ThreadPoolExecutor:
+    """Get the thread pool used for stacking, creating it if needed
+
+    The pool is recreated in forked processes (e.g. dataloader workers) since its threads do not
+    survive the fork.
+    """
+    global _stack_pool, _stack_pool_pid
+    if _stack_pool is None or _stack_pool_pid != os.getpid():
+        _stack_pool = futures.ThreadPoolExecutor(max_workers=_STACK_POOL_MAX_WORKERS)
+        _stack_pool_pid = os.getpid()
+    return _stack_pool
+
+
+# Keys whose values are the same for all examples, so are not stacked along a batch dimension
+_CONSTANT_KEYS = frozenset(
+    [key for key in list(BatchKey) + list(NWPBatchKey) if key.name.endswith("t0_idx")]
+    + [NWPBatchKey.nwp_channel_names]
+)
+
 
 def _key_is_constant(batch_key):
-    is_constant = batch_key.name.endswith("t0_idx") or batch_key == NWPBatchKey.nwp_channel_names
-    return is_constant
+    return batch_key in _CONSTANT_KEYS
 
 
-def stack_data_list(
+def _allocate_buffer(shape: tuple, dtype: np.dtype, pin_memory: bool) -> np.ndarray:
+    """Allocate an empty array, optionally in page-locked memory for faster copies to the GPU"""
+    if pin_memory:
+        try:
+            torch_dtype = torch.from_numpy(np.empty(0, dtype=dtype)).dtype
+        except TypeError:
+            # Dtypes without a torch equivalent (e.g. strings) cannot be pinned
+            pass
+        else:
+            return torch.empty(shape, dtype=torch_dtype, pin_memory=True).numpy()
+    return np.empty(shape, dtype=dtype)
+
+
+def _get_buffer(buffers: dict, buffer_key: tuple, data_list: Sequence, pin_memory: bool):
+    """Get the cached output buffer for stacking `data_list`, allocating it on first use"""
+    first = np.asarray(data_list[0])
+    shape = (len(data_list),) + first.shape
+    key = buffer_key + (shape, first.dtype)
+    if key not in buffers:
+        buffers[key] = _allocate_buffer(shape, first.dtype, pin_memory)
+    return buffers[key]
+
+
+def _stack_arrays(
     data_list: Sequence,
     batch_key: Union[BatchKey, NWPBatchKey],
+    out: Optional[np.ndarray] = None,
 ):
-    """How to combine data entries for each key
+    """Stack the non-constant data entries of a key along a new batch dimension
 
-    See also: `extract_sample_from_batch()` for opposite
+    If `out` is given the data is stacked into it rather than into a new array.
     """
-    if _key_is_constant(batch_key):
-        # These are always the same for all examples.
-        return data_list[0]
     try:
-        return np.stack(data_list)
+        if out is not None:
+            return np.stack(data_list, out=out)
+        arrays = [np.asarray(data) for data in data_list]
+        shape = arrays[0].shape
+        if all(array.shape == shape for array in arrays):
+            # Copy each example straight into a preallocated batch array. This is a single copy
+            # per example, even for non-contiguous examples
+            batch = np.empty((len(arrays),) + shape, dtype=np.result_type(*arrays))
+            for i, array in enumerate(arrays):
+                batch[i] = array
+            return batch
+        # Fall back to `np.stack()` so mismatched shapes raise its usual error
+        return np.stack(arrays)
     except Exception as e:
         logger.debug(f"Could not stack the following shapes together, ({batch_key})")
         shapes = [example.shape for example in data_list]
@@ -37,6 +100,20 @@ def stack_data_list(
         raise e
 
 
+def stack_data_list(
+    data_list: Sequence,
+    batch_key: Union[BatchKey, NWPBatchKey],
+):
+    """How to combine data entries for each key
+
+    See also: `extract_sample_from_batch()` for opposite
+    """
+    if _key_is_constant(batch_key):
+        # These are always the same for all examples.
+        return data_list[0]
+    return _stack_arrays(data_list, batch_key)
+
+
 def extract_sample_from_batch(
     data,
     batch_key: Union[BatchKey, NWPBatchKey],
@@ -53,6 +130,124 @@ def extract_sample_from_batch(
         return data[index_num]
 
 
+def _split_constant_keys(keys) -> tuple[tuple, tuple]:
+    """Split keys into a tuple of non-constant keys and a tuple of constant keys"""
+    non_constant_keys = tuple(key for key in keys if not _key_is_constant(key))
+    constant_keys = tuple(key for key in keys if _key_is_constant(key))
+    return non_constant_keys, constant_keys
+
+
+def _get_batch_schema(np_batch: NumpyBatch) -> tuple:
+    """Find the keys of an example or batch and split them by whether they are constant
+
+    The schema is the same for every example yielded by a pipeline, so it can be computed once
+    and reused.
+
+    Args:
+        np_batch: A NumpyBatch example or batch
+
+    Returns:
+        Tuple of `(top_keys, constant_top_keys, nwp_sources, nwp_keys, constant_nwp_keys)`. The
+        top-level keys exclude `BatchKey.nwp`. `nwp_sources` is None if there is no NWP data, else
+        a tuple of the NWP sources. `nwp_keys` and `constant_nwp_keys` map each NWP source to its
+        non-constant and constant keys respectively.
+    """
+    top_keys, constant_top_keys = _split_constant_keys(
+        [key for key in np_batch.keys() if key != BatchKey.nwp]
+    )
+
+    nwp_sources = None
+    nwp_keys = {}
+    constant_nwp_keys = {}
+    if BatchKey.nwp in np_batch:
+        nwp_sources = tuple(np_batch[BatchKey.nwp].keys())
+        for nwp_source in nwp_sources:
+            # Keys can be different for different NWPs
+            nwp_keys[nwp_source], constant_nwp_keys[nwp_source] = _split_constant_keys(
+                np_batch[BatchKey.nwp][nwp_source].keys()
+            )
+
+    return top_keys, constant_top_keys, nwp_sources, nwp_keys, constant_nwp_keys
+
+
+def _stack_with_schema(
+    dict_list: Sequence[NumpyBatch],
+    schema: tuple,
+    buffers: Optional[dict] = None,
+    pin_memory: bool = False,
+) -> NumpyBatch:
+    """Stack Numpy examples into a batch using a precomputed schema from `_get_batch_schema()`
+
+    Args:
+        dict_list: A list of dict-like Numpy examples to stack
+        schema: The schema of the examples
+        buffers: If given, a cache of output arrays to stack into, keyed by NWP source, key, shape
+            and dtype. Missing buffers are allocated and added to it.
+        pin_memory: Whether newly allocated buffers should be in page-locked memory
+    """
+    top_keys, constant_top_keys, nwp_sources, nwp_keys, constant_nwp_keys = schema
+
+    # Constant keys are always the same for all examples
+    batch: NumpyBatch = {key: dict_list[0][key] for key in constant_top_keys}
+
+    # Collect the (output dict, key, data list, buffer key) of every key which needs stacking
+    stack_tasks = [
+        (batch, batch_key, [d[batch_key] for d in dict_list], (None, batch_key))
+        for batch_key in top_keys
+    ]
+
+    # NWP is nested so treat separately
+    if nwp_sources is not None:
+        nwp_batch: dict[str, NWPNumpyBatch] = {}
+
+        for nwp_source in nwp_sources:
+            nwp_examples = [d[BatchKey.nwp][nwp_source] for d in dict_list]
+
+            nwp_source_batch: NWPNumpyBatch = {
+                nwp_batch_key: nwp_examples[0][nwp_batch_key]
+                for nwp_batch_key in constant_nwp_keys[nwp_source]
+            }
+            stack_tasks += [
+                (
+                    nwp_source_batch,
+                    nwp_batch_key,
+                    [d[nwp_batch_key] for d in nwp_examples],
+                    (nwp_source, nwp_batch_key),
+                )
+                for nwp_batch_key in nwp_keys[nwp_source]
+            ]
+
+            nwp_batch[nwp_source] = nwp_source_batch
+
+        batch[BatchKey.nwp] = nwp_batch
+
+    def stack(data_list, batch_key, buffer_key):
+        out = None if buffers is None else _get_buffer(buffers, buffer_key, data_list, pin_memory)
+        return _stack_arrays(data_list, batch_key, out=out)
+
+    small_tasks, large_tasks = [], []
+    for task in stack_tasks:
+        data_list = task[2]
+        n_bytes = np.asarray(data_list[0]).nbytes * len(data_list)
+        (large_tasks if n_bytes >= _MIN_BYTES_TO_STACK_IN_PARALLEL else small_tasks).append(task)
+    if len(large_tasks) < 2:
+        # Nothing to overlap, so stack everything in this thread
+        small_tasks, large_tasks = stack_tasks, []
+
+    # The copies release the GIL, so the large keys can be stacked concurrently
+    stack_futures = [
+        _get_stack_pool().submit(stack, data_list, batch_key, buffer_key)
+        for _, batch_key, data_list, buffer_key in large_tasks
+    ]
+    # Stack the small keys in this thread while the pool works on the large ones
+    for output, batch_key, data_list, buffer_key in small_tasks:
+        output[batch_key] = stack(data_list, batch_key, buffer_key)
+    for (output, batch_key, _, _), future in zip(large_tasks, stack_futures):
+        output[batch_key] = future.result()
+
+    return batch
+
+
 def stack_np_examples_into_batch(dict_list: Sequence[NumpyBatch]) -> NumpyBatch:
     """
     Stacks Numpy examples into a batch
@@ -65,40 +260,55 @@ def stack_np_examples_into_batch(dict_list: Sequence[NumpyBatch]) -> NumpyBatch:
     Returns:
         The stacked NumpyBatch object
     """
-    batch: NumpyBatch = {}
-
-    batch_keys = list(dict_list[0].keys())
+    return _stack_with_schema(dict_list, _get_batch_schema(dict_list[0]))
+
+
+def _unstack_with_schema(batch: NumpyBatch, schema: tuple) -> list[NumpyBatch]:
+    """Split a batch into samples using a precomputed schema from `_get_batch_schema()`"""
+    top_keys, constant_top_keys, nwp_sources, nwp_keys, constant_nwp_keys = schema
+
+    # Resolve the arrays of each key once, rather than looking them up for every sample. Constant
+    # items are shared by all samples
+    constant_top_items = {key: batch[key] for key in constant_top_keys}
+    top_arrays = tuple((key, batch[key]) for key in top_keys)
+    nwp_arrays = {}
+    if nwp_sources is not None:
+        for nwp_source in nwp_sources:
+            nwp_source_data = batch[BatchKey.nwp][nwp_source]
+            nwp_arrays[nwp_source] = (
+                {key: nwp_source_data[key] for key in constant_nwp_keys[nwp_source]},
+                tuple((key, nwp_source_data[key]) for key in nwp_keys[nwp_source]),
+            )
 
-    for batch_key in batch_keys:
+    # Look at a non-constant key and find batch_size. Trickier if key is NWP
+    if len(top_arrays) > 0:
+        batch_size = top_arrays[0][1].shape[0]
+    else:
         # NWP is nested so treat separately
-        if batch_key == BatchKey.nwp:
-            nwp_batch: dict[str, NWPNumpyBatch] = {}
-
-            # Unpack source keys
-            nwp_sources = list(dict_list[0][BatchKey.nwp].keys())
+        nwp_source = next(filter(lambda x: len(nwp_arrays[x][1]) > 0, nwp_sources))
+        batch_size = nwp_arrays[nwp_source][1][0][1].shape[0]
 
-            for nwp_source in nwp_sources:
-                # Keys can be different for different NWPs
-                nwp_batch_keys = list(dict_list[0][BatchKey.nwp][nwp_source].keys())
+    def build_sample(i: int) -> NumpyBatch:
+        # Indexing the first dimension returns a view, so no data is copied
+        sample: NumpyBatch = {**constant_top_items, **{key: array[i] for key, array in top_arrays}}
 
-                nwp_source_batch: NWPNumpyBatch = {}
-                for nwp_batch_key in nwp_batch_keys:
-                    nwp_source_batch[nwp_batch_key] = stack_data_list(
-                        [d[BatchKey.nwp][nwp_source][nwp_batch_key] for d in dict_list],
-                        nwp_batch_key,
-                    )
-
-                nwp_batch[nwp_source] = nwp_source_batch
+        # NWP is nested so treat separately
+        if nwp_sources is not None:
+            sample[BatchKey.nwp] = {
+                nwp_source: {
+                    **constant_items,
+                    **{nwp_key: array[i] for nwp_key, array in nwp_source_arrays},
+                }
+                for nwp_source, (constant_items, nwp_source_arrays) in nwp_arrays.items()
+            }
 
-            batch[BatchKey.nwp] = nwp_batch
+        return sample
 
-        else:
-            batch[batch_key] = stack_data_list(
-                [d[batch_key] for d in dict_list],
-                batch_key,
-            )
-
-    return batch
+    # Loop through and split the batch into samples
+    samples = [None] * batch_size
+    for i in range(batch_size):
+        samples[i] = build_sample(i)
+    return samples
 
 
 def unstack_np_batch_into_examples(batch: NumpyBatch):
@@ -110,82 +320,54 @@ def unstack_np_batch_into_examples(batch: NumpyBatch):
 
     See also: `stack_np_examples_into_batch()` for opposite
     """
-    batch_keys = list(batch.keys())
-
-    # Look at a non-constant key and find batch_size. Trickier if key is NWP
-    non_constant_key = next(filter(lambda x: not _key_is_constant(x), batch_keys))
-    if non_constant_key == BatchKey.nwp:
-        # NWP is nested so treat separately
-        nwp_source = next(iter(batch[BatchKey.nwp].keys()))
-        non_constant_nwp_key = next(
-            filter(
-                lambda x: not _key_is_constant(x),
-                list(batch[BatchKey.nwp][nwp_source].keys()),
-            )
-        )
-        batch_size = batch[BatchKey.nwp][nwp_source][non_constant_nwp_key].shape[0]
-    else:
-        batch_size = batch[non_constant_key].shape[0]
-
-    # Loop through and split the batch into samples
-    samples = []
-    for i in range(batch_size):
-        sample: NumpyBatch = {}
-
-        for key in batch_keys:
-            # NWP is nested so treat separately
-            if key == BatchKey.nwp:
-                nwp_batch: dict[str, NWPNumpyBatch] = {}
-
-                # Unpack keys
-                nwp_sources = list(batch[BatchKey.nwp].keys())
-
-                for nwp_source in nwp_sources:
-                    nwp_source_batch: NWPNumpyBatch = {}
-
-                    # Keys can be different for each NWP source
-                    nwp_keys = list(batch[BatchKey.nwp][nwp_source].keys())
-
-                    for nwp_key in nwp_keys:
-                        nwp_source_batch[nwp_key] = extract_sample_from_batch(
-                            batch[BatchKey.nwp][nwp_source][nwp_key],
-                            batch_key=nwp_key,
-                            index_num=i,
-                        )
-
-                    nwp_batch[nwp_source] = nwp_source_batch
-
-                sample[BatchKey.nwp] = nwp_batch
-
-            else:
-                sample[key] = extract_sample_from_batch(
-                    batch[key],
-                    batch_key=key,
-                    index_num=i,
-                )
-
-        samples += [sample]
-    return samples
+    return _unstack_with_schema(batch, _get_batch_schema(batch))
 
 
 @functional_datapipe("merge_numpy_batch")
 class MergeNumpyBatchIterDataPipe(IterDataPipe):
     """Merge list of individual examples into a batch"""
 
-    def __init__(self, source_datapipe: IterDataPipe):
+    def __init__(
+        self,
+        source_datapipe: IterDataPipe,
+        reuse_buffers: bool = False,
+        pin_memory: bool = False,
+        n_buffers: int = 1,
+    ):
         """
         Merge list of individual examples into a batch
 
         Args:
             source_datapipe: Datapipe of yielding lists of numpybatch examples
+            reuse_buffers: Whether to stack each batch into the same output arrays rather than
+                allocating new ones. If True, the arrays of a yielded batch are overwritten by the
+                next batch, so consumers must not hold references to them past the next iteration.
+            pin_memory: Whether to allocate the reused output arrays in page-locked memory, for
+                faster (and asynchronous) copies to the GPU. Only used if `reuse_buffers` is True.
+                Requires CUDA.
+            n_buffers: Number of sets of output arrays to cycle through when reusing buffers. With
+                2 (double buffering) the arrays of a yielded batch are not overwritten until the
+                batch after next, so a batch can be copied asynchronously to the GPU while the
+                next is stacked. Only used if `reuse_buffers` is True.
         """
         self.source_datapipe = source_datapipe
+        self.pin_memory = pin_memory
+        self._schema = None
+        self._buffers = [{} for _ in range(n_buffers)] if reuse_buffers else None
 
     def __iter__(self) -> NumpyBatch:
         """Merge list of individual examples into a batch"""
         logger.debug("Merging numpy batch")
-        for examples_list in self.source_datapipe:
-            yield stack_np_examples_into_batch(examples_list)
+        for i, examples_list in enumerate(self.source_datapipe):
+            # The keys are the same for every example so only inspect them once
+            if self._schema is None:
+                self._schema = _get_batch_schema(examples_list[0])
+            yield _stack_with_schema(
+                examples_list,
+                self._schema,
+                buffers=None if self._buffers is None else self._buffers[i % len(self._buffers)],
+                pin_memory=self.pin_memory,
+            )
 
 
 # TODO: Is this needed anymore? Instead we can do either of:
@@ -205,13 +387,17 @@ class MergeNumpyExamplesToBatchIterDataPipe(IterDataPipe):
         """
         self.source_datapipe = source_datapipe
         self.n_examples_per_batch = n_examples_per_batch
+        self._schema = None
 
     def __iter__(self) -> NumpyBatch:
         """Merge individual examples into a batch"""
         np_examples = []
         logger.debug("Merging numpy batch")
         for np_batch in self.source_datapipe:
+            # The keys are the same for every example so only inspect them once
+            if self._schema is None:
+                self._schema = _get_batch_schema(np_batch)
             np_examples.append(np_batch)
             if len(np_examples) == self.n_examples_per_batch:
-                yield stack_np_examples_into_batch(np_examples)
+                yield _stack_with_schema(np_examples, self._schema)
                 np_examples = []
@@ -13,16 +13,19 @@ logger = logging.getLogger(__name__)
 
 def convert_pv_to_numpy_batch(xr_data):
     """Convert PV Xarray to NumpyBatch"""
+    # Read the coordinate variables directly, rather than building a DataArray for each one
+    coords = xr_data.coords.variables
+
     example: NumpyBatch = {
         BatchKey.pv: xr_data.values,
         BatchKey.pv_t0_idx: xr_data.attrs["t0_idx"],
-        BatchKey.pv_ml_id: xr_data["ml_id"].values,
-        BatchKey.pv_id: xr_data["pv_system_id"].values.astype(np.float32),
-        BatchKey.pv_observed_capacity_wp: (xr_data["observed_capacity_wp"].values),
-        BatchKey.pv_nominal_capacity_wp: (xr_data["nominal_capacity_wp"].values),
-        BatchKey.pv_time_utc: datetime64_to_float(xr_data["time_utc"].values),
-        BatchKey.pv_latitude: xr_data["latitude"].values,
-        BatchKey.pv_longitude: xr_data["longitude"].values,
+        BatchKey.pv_ml_id: coords["ml_id"].values,
+        BatchKey.pv_id: coords["pv_system_id"].values.astype(np.float32),
+        BatchKey.pv_observed_capacity_wp: coords["observed_capacity_wp"].values,
+        BatchKey.pv_nominal_capacity_wp: coords["nominal_capacity_wp"].values,
+        BatchKey.pv_time_utc: datetime64_to_float(coords["time_utc"].values),
+        BatchKey.pv_latitude: coords["latitude"].values,
+        BatchKey.pv_longitude: coords["longitude"].values,
     }
 
     return example
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import xarray as xr
 from ocf_blosc2 import Blosc2  # noqa: F401
@@ -26,6 +26,7 @@ class OpenNWPIterDataPipe(IterDataPipe):
         self,
         zarr_path: Union[Path, str, list[Path], list[str]],
         provider: str = "ukv",
+        chunks: Optional[Union[str, dict]] = "auto",
     ):
         """
         Opens NWP Zarr and yields it
@@ -33,8 +34,11 @@ class OpenNWPIterDataPipe(IterDataPipe):
         Args:
             zarr_path: Path to the Zarr file
             provider: NWP provider
+            chunks: Chunks to open the data with using dask. If None, the data is opened without
+                dask, which avoids the overhead of building dask graphs for small datasets
         """
         self.zarr_path = zarr_path
+        self.chunks = chunks
         logger.info(f"Using {provider.lower()}")
         if provider.lower() == "ukv":
             self.open_nwp = open_ukv
@@ -56,6 +60,6 @@ class OpenNWPIterDataPipe(IterDataPipe):
     def __iter__(self) -> Union[xr.DataArray, xr.Dataset]:
         """Opens the NWP data"""
         logger.debug("Opening NWP data: %s", self.zarr_path)
-        nwp = self.open_nwp(self.zarr_path)
+        nwp = self.open_nwp(self.zarr_path, chunks=self.chunks)
         while True:
             yield nwp
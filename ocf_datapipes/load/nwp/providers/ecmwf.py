@@ -6,18 +6,19 @@ import xarray as xr
 from ocf_datapipes.load.nwp.providers.utils import open_zarr_paths
 
 
-def open_ifs(zarr_path) -> xr.DataArray:
+def open_ifs(zarr_path, chunks="auto") -> xr.DataArray:
     """
     Opens the ECMWF IFS NWP data
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
     # Open the data
-    nwp = open_zarr_paths(zarr_path)
+    nwp = open_zarr_paths(zarr_path, chunks=chunks)
     dataVars = list(nwp.data_vars.keys())
     if len(dataVars) > 1:
         raise Exception("Too many TLDVs")
@@ -26,19 +26,20 @@ def preprocess_excarta(ds: xr.Dataset) -> xr.Dataset:
     return ds
 
 
-def open_excarta(zarr_path) -> xr.DataArray:
+def open_excarta(zarr_path, chunks="auto") -> xr.DataArray:
     """
     Opens the Excarta hindcast data
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
 
     if "hindcast.zarr" in str(zarr_path):  # Preprocessed one
-        nwp = open_zarr_paths(zarr_path)
+        nwp = open_zarr_paths(zarr_path, chunks=chunks)
         nwp = nwp.rename({"__xarray_dataarray_variable__": "excarta"})
         nwp: xr.DataArray = nwp["excarta"]
         time = pd.DatetimeIndex(nwp.init_time_utc)
@@ -56,7 +57,7 @@ def open_excarta(zarr_path) -> xr.DataArray:
             )
     # Open the data
     nwp: xr.Dataset = open_zarr_paths(
-        zarr_path, time_dim="init_time_utc", preprocessor=preprocess_excarta
+        zarr_path, time_dim="init_time_utc", preprocessor=preprocess_excarta, chunks=chunks
     )
     nwp = nwp.rename({"prediction_timedelta": "step"})
     nwp = nwp.sortby("init_time_utc")
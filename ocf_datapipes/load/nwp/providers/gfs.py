@@ -10,12 +10,13 @@ import xarray as xr
 _log = logging.getLogger(__name__)
 
 
-def open_gfs(zarr_path: Union[Path, str]) -> xr.Dataset:
+def open_gfs(zarr_path: Union[Path, str], chunks="auto") -> xr.Dataset:
     """
     Opens GFS dataset
 
     Args:
         zarr_path: Path to Zarr(s) to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray dataset of GFS Forecasts
@@ -24,9 +25,9 @@ def open_gfs(zarr_path: Union[Path, str]) -> xr.Dataset:
     _log.info("Loading NWP GFS data")
 
     if "*" in zarr_path:
-        nwp = xr.open_mfdataset(zarr_path, engine="zarr", combine="time", chunks="auto")
+        nwp = xr.open_mfdataset(zarr_path, engine="zarr", combine="time", chunks=chunks)
     else:
-        nwp = xr.load_dataset(zarr_path, engine="zarr", mode="r", chunks="auto")
+        nwp = xr.load_dataset(zarr_path, engine="zarr", mode="r", chunks=chunks)
 
     variables = list(nwp.keys())
 
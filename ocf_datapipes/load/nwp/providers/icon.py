@@ -6,7 +6,7 @@ import xarray as xr
 from ocf_datapipes.load.nwp.providers.utils import open_zarr_paths
 
 
-def open_icon_eu(zarr_path) -> xr.Dataset:
+def open_icon_eu(zarr_path, chunks="auto") -> xr.Dataset:
     """
     Opens the ICON data
 
@@ -16,12 +16,13 @@ def open_icon_eu(zarr_path) -> xr.Dataset:
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
     # Open the data
-    nwp = open_zarr_paths(zarr_path, time_dim="time")
+    nwp = open_zarr_paths(zarr_path, time_dim="time", chunks=chunks)
     nwp = nwp.rename({"time": "init_time_utc"})
     # Sanity checks.
     time = pd.DatetimeIndex(nwp.init_time_utc)
@@ -30,7 +31,7 @@ def open_icon_eu(zarr_path) -> xr.Dataset:
     return nwp
 
 
-def open_icon_global(zarr_path) -> xr.Dataset:
+def open_icon_global(zarr_path, chunks="auto") -> xr.Dataset:
     """
     Opens the ICON data
 
@@ -40,12 +41,13 @@ def open_icon_global(zarr_path) -> xr.Dataset:
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
     # Open the data
-    nwp = open_zarr_paths(zarr_path, time_dim="time")
+    nwp = open_zarr_paths(zarr_path, time_dim="time", chunks=chunks)
     nwp = nwp.rename({"time": "init_time_utc"})
     # ICON Global archive script didn't define the values to be
     # associated with lat/lon so fixed here
@@ -6,18 +6,19 @@ import xarray as xr
 from ocf_datapipes.load.nwp.providers.utils import open_zarr_paths
 
 
-def open_merra2(zarr_path) -> xr.DataArray:
+def open_merra2(zarr_path, chunks="auto") -> xr.DataArray:
     """
     Opens the MERRA2 AOD data
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
     # Open the data
-    nwp = open_zarr_paths(zarr_path)
+    nwp = open_zarr_paths(zarr_path, chunks=chunks)
 
     init_time = nwp.time[0]
     nwp = nwp.expand_dims({"init_time_utc": [init_time.values]})
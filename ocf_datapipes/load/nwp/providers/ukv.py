@@ -7,18 +7,19 @@ import xarray as xr
 from ocf_datapipes.load.nwp.providers.utils import open_zarr_paths
 
 
-def open_ukv(zarr_path) -> xr.DataArray:
+def open_ukv(zarr_path, chunks="auto") -> xr.DataArray:
     """
     Opens the NWP data
 
     Args:
         zarr_path: Path to the zarr to open
+        chunks: Chunks to open the data with using dask. If None, the data is opened without dask
 
     Returns:
         Xarray DataArray of the NWP data
     """
     # Open the data
-    nwp = open_zarr_paths(zarr_path)
+    nwp = open_zarr_paths(zarr_path, chunks=chunks)
     ukv: xr.DataArray = nwp["UKV"]
     del nwp
     ukv = ukv.transpose("init_time", "step", "variable", "y", "x")
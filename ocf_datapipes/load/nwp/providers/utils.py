@@ -1,11 +1,16 @@
 """Common NWP providers"""
 
-from typing import Callable
+from typing import Callable, Optional, Union
 
 import xarray as xr
 
 
-def open_zarr_paths(zarr_path, time_dim="init_time", preprocessor: Callable = None) -> xr.Dataset:
+def open_zarr_paths(
+    zarr_path,
+    time_dim="init_time",
+    preprocessor: Callable = None,
+    chunks: Optional[Union[str, dict]] = "auto",
+) -> xr.Dataset:
     """
     Opens the NWP data
 
@@ -13,6 +18,9 @@ def open_zarr_paths(zarr_path, time_dim="init_time", preprocessor: Callable = No
         zarr_path: Path to the zarr(s) to open
         time_dim: Name of the time dimension
         preprocessor: Optional preprocessor to apply to the dataset
+        chunks: Chunks to open the data with using dask. If None, a single zarr is opened without
+            dask, which avoids building dask graphs for small data. Multi-file datasets always use
+            dask
 
     Returns:
         The opened Xarray Dataset
@@ -23,8 +31,10 @@ def open_zarr_paths(zarr_path, time_dim="init_time", preprocessor: Callable = No
             engine="zarr",
             concat_dim=time_dim,
             combine="nested",
-            chunks="auto",
+            chunks=chunks,
             preprocess=preprocessor,
+            # Open the zarrs concurrently, rather than waiting on each one's metadata in turn
+            parallel=True,
         ).sortby(time_dim)
     else:
         nwp = xr.open_dataset(
@@ -32,6 +42,6 @@ def open_zarr_paths(zarr_path, time_dim="init_time", preprocessor: Callable = No
             engine="zarr",
             consolidated=True,
             mode="r",
-            chunks="auto",
+            chunks=chunks,
         )
     return nwp
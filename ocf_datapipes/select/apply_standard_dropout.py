@@ -71,6 +71,19 @@ class ApplyDropoutTimeIterDataPipe(IterDataPipe):
         for xr_data, dropout_time in self.source_datapipe.zip_ocf(self.dropout_time_datapipe):
             if dropout_time is None:
                 yield xr_data
-            else:
-                # This replaces the times after the dropout with NaNs
-                yield xr_data.where(xr_data.time_utc <= dropout_time)
+                continue
+
+            keep_mask = xr_data.time_utc <= dropout_time
+
+            if keep_mask.all():
+                # Nothing to mask, so avoid copying the data and promoting its dtype
+                yield xr_data
+                continue
+
+            if isinstance(xr_data, xr.DataArray) and not np.issubdtype(xr_data.dtype, np.floating):
+                # Masking needs a float dtype. Use float32 rather than letting xarray promote
+                # integer data (e.g. int16 satellite) to float64
+                xr_data = xr_data.astype(np.float32)
+
+            # This replaces the times after the dropout with NaNs
+            yield xr_data.where(keep_mask)
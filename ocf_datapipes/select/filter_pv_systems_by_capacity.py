@@ -29,11 +29,14 @@ class FilterPVSystemsOnCapacityIterDataPipe(IterDataPipe):
         """
         self.source_datapipe = source_datapipe
         self.min_capacity_watts = min_capacity_watts
-        self.max_capaciity_watts = max_capacity_watts
+        self.max_capacity_watts = max_capacity_watts
 
     def __iter__(self) -> Union[xr.DataArray, xr.Dataset]:
         for ds in self.source_datapipe:
-            too_low = ds.observed_capacity_wp < self.min_capacity_watts
-            too_high = ds.observed_capacity_wp > self.max_capacity_watts
+            capacity = ds.observed_capacity_wp.values
+            too_low = capacity < self.min_capacity_watts
+            too_high = capacity > self.max_capacity_watts
             mask = np.logical_or(too_low, too_high)
-            yield ds.where(~mask, drop=True)
+            # Index the PV system dimension directly rather than using `where(..., drop=True)`,
+            # which would mask every variable with NaNs before dropping
+            yield ds.isel({ds.observed_capacity_wp.dims[0]: np.flatnonzero(~mask)})
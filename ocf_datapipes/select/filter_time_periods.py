@@ -3,6 +3,7 @@
 import logging
 from typing import Union
 
+import numpy as np
 import xarray as xr
 from torch.utils.data import IterDataPipe, functional_datapipe
 
@@ -33,12 +34,20 @@ class FilterTimePeriodsIterDataPipe(IterDataPipe):
 
     def __iter__(self) -> Union[xr.DataArray, xr.Dataset]:
         for xr_data, time_periods in self.source_datapipe.zip_ocf(self.time_periods):
-            new_xr_data = []
             logger.debug(f"Selecting Time periods ({len(time_periods)})")
-            for _, row in time_periods.iterrows():
-                start_dt = row["start_dt"]
-                end_dt = row["end_dt"]
-                new_xr_data.append(xr_data.sel({self.dim_name: slice(start_dt, end_dt)}))
-
-            xr_data_concat = xr.concat(new_xr_data, dim=self.dim_name)
-            yield xr_data_concat
+            times = xr_data[self.dim_name].values
+
+            # Find the (inclusive) index range of each period in the sorted time coordinate
+            start_idxs = np.searchsorted(
+                times, time_periods["start_dt"].to_numpy(dtype="datetime64[ns]"), side="left"
+            )
+            end_idxs = np.searchsorted(
+                times, time_periods["end_dt"].to_numpy(dtype="datetime64[ns]"), side="right"
+            )
+
+            # Build a single mask over the time coordinate so we only index the data once
+            mask = np.zeros(len(times), dtype=bool)
+            for start_idx, end_idx in zip(start_idxs, end_idxs):
+                mask[start_idx:end_idx] = True
+
+            yield xr_data.isel({self.dim_name: np.flatnonzero(mask)})
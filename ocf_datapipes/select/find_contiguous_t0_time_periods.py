@@ -170,21 +170,21 @@ def find_contiguous_time_periods(
     # Capture the last segment of dt_index.
     segment_boundaries = np.concatenate((segment_boundaries, [len(datetimes)]))
 
-    periods: list[dict[str, pd.Timestamp]] = []
-    start_i = 0
-    for next_start_i in segment_boundaries:
-        n_timesteps = next_start_i - start_i
-        if n_timesteps > min_seq_length:
-            end_i = next_start_i - 1
-            period = {"start_dt": datetimes[start_i], "end_dt": datetimes[end_i]}
-            periods.append(period)
-        start_i = next_start_i
-
-    assert len(periods) > 0, (
+    # Find the start index of each segment, and keep the segments which are long enough
+    segment_starts = np.concatenate(([0], segment_boundaries[:-1]))
+    n_timesteps = segment_boundaries - segment_starts
+    long_enough = n_timesteps > min_seq_length
+
+    assert long_enough.any(), (
         f"Did not find an periods from {datetimes}. " f"{min_seq_length=} {max_gap_duration=}"
     )
 
-    return pd.DataFrame(periods)
+    return pd.DataFrame(
+        {
+            "start_dt": datetimes[segment_starts[long_enough]],
+            "end_dt": datetimes[segment_boundaries[long_enough] - 1],
+        }
+    )
 
 
 def find_contiguous_t0_time_periods(
@@ -3,7 +3,7 @@
 import logging
 
 import numpy as np
-from torch.utils.data import IterDataPipe, functional_datapipe
+from torch.utils.data import IterDataPipe, functional_datapipe, get_worker_info
 
 from ocf_datapipes.utils import Location
 from ocf_datapipes.utils.geospatial import spatial_coord_type
@@ -11,6 +11,19 @@ from ocf_datapipes.utils.geospatial import spatial_coord_type
 logger = logging.getLogger(__name__)
 
 
+def _get_location_values(xr_dataset, xr_x_dim: str, xr_y_dim: str):
+    """Get the x, y and (if present) ID coordinate values of each location as numpy arrays"""
+    x_values = np.asarray(xr_dataset[xr_x_dim].values)
+    y_values = np.asarray(xr_dataset[xr_y_dim].values)
+
+    id_values = None
+    for id_dim_name in ["pv_system_id", "gsp_id", "station_id"]:
+        if id_dim_name in xr_dataset.coords.keys():
+            id_values = np.asarray(xr_dataset[id_dim_name].values)
+
+    return x_values, y_values, id_values
+
+
 @functional_datapipe("pick_locations")
 class PickLocationsIterDataPipe(IterDataPipe):
     """Picks random locations from a dataset"""
@@ -20,6 +33,7 @@ class PickLocationsIterDataPipe(IterDataPipe):
         source_datapipe: IterDataPipe,
         return_all: bool = False,
         shuffle: bool = False,
+        seed=None,
     ):
         """
         Datapipe to yield locations from the input data source.
@@ -30,57 +44,73 @@ class PickLocationsIterDataPipe(IterDataPipe):
                 if True, also returns them in structured order
             shuffle: If `return_all` is True this sets whether the pairs are
                 shuffled before being returned.
+            seed: Random seed for choosing locations. In a DataLoader worker this is combined with
+                the worker ID so that workers pick different locations. If None, workers use the
+                seed torch gives them
         """
         super().__init__()
         self.source_datapipe = source_datapipe
         self.return_all = return_all
         self.shuffle = shuffle
+        self.seed = seed
+
+    def _get_rng(self):
+        """Make a random generator which is different for each DataLoader worker"""
+        worker_info = get_worker_info()
+        if worker_info is None:
+            return np.random.default_rng(seed=self.seed)
+        elif self.seed is None:
+            # Torch gives each worker a different seed each epoch
+            return np.random.default_rng(seed=worker_info.seed)
+        else:
+            return np.random.default_rng(seed=[self.seed, worker_info.id])
 
-    def _yield_all_iter(self, xr_dataset):
+    def _yield_all_iter(self, xr_dataset, rng):
         """Samples without replacement from possible locations"""
         # Get the spatial coords
         xr_coord_system, xr_x_dim, xr_y_dim = spatial_coord_type(xr_dataset)
 
-        loc_indices = np.arange(len(xr_dataset[xr_x_dim]))
+        # Pull out the coordinate values once to avoid xarray indexing on every location
+        x_values, y_values, id_values = _get_location_values(xr_dataset, xr_x_dim, xr_y_dim)
+
+        loc_indices = np.arange(len(x_values))
 
         if self.shuffle:
-            loc_indices = np.random.permutation(loc_indices)
+            loc_indices = rng.permutation(loc_indices)
 
         # Iterate through all locations in dataset
         for loc_index in loc_indices:
             # Get the location ID
-            loc_id = None
-            for id_dim_name in ["pv_system_id", "gsp_id", "station_id"]:
-                if id_dim_name in xr_dataset.coords.keys():
-                    loc_id = int(xr_dataset[id_dim_name][loc_index].values)
+            loc_id = None if id_values is None else int(id_values[loc_index])
 
             location = Location(
                 coordinate_system=xr_coord_system,
-                x=xr_dataset[xr_x_dim][loc_index].values,
-                y=xr_dataset[xr_y_dim][loc_index].values,
+                x=x_values[loc_index],
+                y=y_values[loc_index],
                 id=loc_id,
             )
 
             yield location
 
-    def _yield_random_iter(self, xr_dataset):
+    def _yield_random_iter(self, xr_dataset, rng):
         """Samples with replacement from possible locations"""
         # Get the spatial coords
         xr_coord_system, xr_x_dim, xr_y_dim = spatial_coord_type(xr_dataset)
 
+        # Pull out the coordinate values once to avoid xarray indexing on every sample
+        x_values, y_values, id_values = _get_location_values(xr_dataset, xr_x_dim, xr_y_dim)
+        num_locations = len(x_values)
+
         while True:
-            loc_index = np.random.randint(0, len(xr_dataset[xr_x_dim]))
+            loc_index = rng.integers(0, num_locations)
 
             # Get the location ID
-            loc_id = None
-            for id_dim_name in ["pv_system_id", "gsp_id", "station_id"]:
-                if id_dim_name in xr_dataset.coords.keys():
-                    loc_id = int(xr_dataset[id_dim_name][loc_index].values)
+            loc_id = None if id_values is None else int(id_values[loc_index])
 
             location = Location(
                 coordinate_system=xr_coord_system,
-                x=xr_dataset[xr_x_dim][loc_index].values,
-                y=xr_dataset[xr_y_dim][loc_index].values,
+                x=x_values[loc_index],
+                y=y_values[loc_index],
                 id=loc_id,
             )
 
@@ -88,8 +118,9 @@ class PickLocationsIterDataPipe(IterDataPipe):
 
     def __iter__(self) -> Location:
         xr_dataset = next(iter(self.source_datapipe))
+        rng = self._get_rng()
 
         if self.return_all:
-            return self._yield_all_iter(xr_dataset)
+            return self._yield_all_iter(xr_dataset, rng)
         else:
-            return self._yield_random_iter(xr_dataset)
+            return self._yield_random_iter(xr_dataset, rng)
@@ -62,6 +62,17 @@ def convert_coords_to_match_xarray(x, y, from_coords, xr_data):
     return x, y
 
 
+def _get_idx_of_nearest(values: np.ndarray, x: float) -> int:
+    """Return the index of the value nearest to x
+
+    Like `pd.Index.get_indexer(..., method="nearest")`, ties are broken towards the larger value.
+    The values must be monotonic.
+    """
+    distances = np.abs(values - x)
+    candidates = np.flatnonzero(distances == distances.min())
+    return int(candidates[np.argmax(values[candidates])])
+
+
 def _get_idx_of_pixel_closest_to_poi(
     xr_data: xr.DataArray,
     location: Location,
@@ -88,15 +99,16 @@ def _get_idx_of_pixel_closest_to_poi(
         xr_data=xr_data,
     )
 
-    # Check that the requested point lies within the data
-    assert xr_data[xr_x_dim].min() < x < xr_data[xr_x_dim].max()
-    assert xr_data[xr_y_dim].min() < y < xr_data[xr_y_dim].max()
+    # Work on the raw coordinate values, which is much faster than using xarray or pandas here
+    x_values = xr_data.get_index(xr_x_dim).values
+    y_values = xr_data.get_index(xr_y_dim).values
 
-    x_index = xr_data.get_index(xr_x_dim)
-    y_index = xr_data.get_index(xr_y_dim)
+    # Check that the requested point lies within the data
+    assert x_values.min() < x < x_values.max()
+    assert y_values.min() < y < y_values.max()
 
-    closest_x = x_index.get_indexer([x], method="nearest")[0]
-    closest_y = y_index.get_indexer([y], method="nearest")[0]
+    closest_x = _get_idx_of_nearest(x_values, x)
+    closest_y = _get_idx_of_nearest(y_values, y)
 
     return Location(x=closest_x, y=closest_y, coordinate_system="idx")
 
@@ -121,19 +133,18 @@ def _get_idx_of_pixel_closest_to_poi_geostationary(
     x, y = osgb_to_geostationary_area_coords(x=center_osgb.x, y=center_osgb.y, xr_data=xr_data)
     center_geostationary = Location(x=x, y=y, coordinate_system="geostationary")
 
+    x_values = xr_data.get_index(xr_x_dim).values
+    y_values = xr_data.get_index(xr_y_dim).values
+
     # Check that the requested point lies within the data
-    assert xr_data[xr_x_dim].min() < x < xr_data[xr_x_dim].max()
-    assert xr_data[xr_y_dim].min() < y < xr_data[xr_y_dim].max()
+    assert x_values.min() < x < x_values.max()
+    assert y_values.min() < y < y_values.max()
 
     # Get the index into x and y nearest to x_center_geostationary and y_center_geostationary:
-    x_index_at_center = searchsorted(
-        xr_data[xr_x_dim].values, center_geostationary.x, assume_ascending=True
-    )
+    x_index_at_center = searchsorted(x_values, center_geostationary.x, assume_ascending=True)
 
     # y_geostationary is in descending order:
-    y_index_at_center = searchsorted(
-        xr_data[xr_y_dim].values, center_geostationary.y, assume_ascending=False
-    )
+    y_index_at_center = searchsorted(y_values, center_geostationary.y, assume_ascending=False)
 
     return Location(x=x_index_at_center, y=y_index_at_center, coordinate_system="idx")
 
@@ -286,8 +297,8 @@ def slice_spatial_pixel_window_from_xarray(
     top_idx = int(center_idx.y - half_height)
     bottom_idx = int(center_idx.y + half_height)
 
-    data_width_pixels = len(xr_data[xr_x_dim])
-    data_height_pixels = len(xr_data[xr_y_dim])
+    data_width_pixels = xr_data.sizes[xr_x_dim]
+    data_height_pixels = xr_data.sizes[xr_y_dim]
 
     left_pad_required = left_idx < 0
     right_pad_required = right_idx >= data_width_pixels
@@ -336,12 +347,12 @@ def slice_spatial_pixel_window_from_xarray(
             }
         )
 
-    assert len(xr_data[xr_x_dim]) == width_pixels, (
-        f"Expected x-dim len {width_pixels} got {len(xr_data[xr_x_dim])} "
+    assert xr_data.sizes[xr_x_dim] == width_pixels, (
+        f"Expected x-dim len {width_pixels} got {xr_data.sizes[xr_x_dim]} "
         f"for location {center_idx} for slice {left_idx}:{right_idx}"
     )
-    assert len(xr_data[xr_y_dim]) == height_pixels, (
-        f"Expected y-dim len {height_pixels} got {len(xr_data[xr_y_dim])} "
+    assert xr_data.sizes[xr_y_dim] == height_pixels, (
+        f"Expected y-dim len {height_pixels} got {xr_data.sizes[xr_y_dim]} "
         f"for location {center_idx} for slice {top_idx}:{bottom_idx}"
     )
 
@@ -411,6 +422,66 @@ def select_spatial_slice_pixels(
     return selected
 
 
+def _get_bounds_meters(
+    x,
+    y,
+    coordinate_system: str,
+    roi_width_meters: int,
+    roi_height_meters: int,
+    xr_data: Union[xr.Dataset, xr.DataArray],
+):
+    """Find the bounding box around locations in the same coordinate system as the xarray data
+
+    Args:
+        x: Float or array-like of location x-coordinates
+        y: Float or array-like of location y-coordinates
+        coordinate_system: Coordinate system of x and y
+        roi_width_meters: ROI width in meters
+        roi_height_meters: ROI height in meters
+        xr_data: xarray data object to which coordinates should be matched
+
+    Returns:
+        left, right, bottom, top
+    """
+    half_width = roi_width_meters // 2
+    half_height = roi_height_meters // 2
+
+    # Find the bounding box values for the location in either lat-lon or OSGB coord systems
+    if coordinate_system == "lon_lat":
+        right, top = move_lon_lat_by_meters(
+            x,
+            y,
+            half_width,
+            half_height,
+        )
+        left, bottom = move_lon_lat_by_meters(
+            x,
+            y,
+            -half_width,
+            -half_height,
+        )
+
+    elif coordinate_system == "osgb":
+        left = x - half_width
+        right = x + half_width
+        bottom = y - half_height
+        top = y + half_height
+
+    else:
+        raise ValueError(f"Location coord system not recognized: {coordinate_system}")
+
+    # Change the bounding coordinates [left, right, bottom, top] to the same
+    # coordinate system as the xarray data
+    (left, right), (bottom, top) = convert_coords_to_match_xarray(
+        x=np.array([left, right], dtype=np.float32),
+        y=np.array([bottom, top], dtype=np.float32),
+        from_coords=coordinate_system,
+        xr_data=xr_data,
+    )
+
+    return left, right, bottom, top
+
+
 def select_spatial_slice_meters(
     xr_data: Union[xr.Dataset, xr.DataArray],
     location: Location,
@@ -448,63 +519,88 @@ def select_spatial_slice_meters(
     # Get the spatial coords of the xarray data
     xr_coords, xr_x_dim, xr_y_dim = spatial_coord_type(xr_data)
 
-    half_width = roi_width_meters // 2
-    half_height = roi_height_meters // 2
-
-    # Find the bounding box values for the location in either lat-lon or OSGB coord systems
-    if location.coordinate_system == "lon_lat":
-        right, top = move_lon_lat_by_meters(
-            location.x,
-            location.y,
-            half_width,
-            half_height,
-        )
-        left, bottom = move_lon_lat_by_meters(
-            location.x,
-            location.y,
-            -half_width,
-            -half_height,
-        )
-
-    elif location.coordinate_system == "osgb":
-        left = location.x - half_width
-        right = location.x + half_width
-        bottom = location.y - half_height
-        top = location.y + half_height
-
-    else:
-        raise ValueError(f"Location coord system not recognized: {location.coordinate_system}")
-
-    # Change the bounding coordinates [left, right, bottom, top] to the same
-    # coordinate system as the xarray data
-    (left, right), (bottom, top) = convert_coords_to_match_xarray(
-        x=np.array([left, right], dtype=np.float32),
-        y=np.array([bottom, top], dtype=np.float32),
-        from_coords=location.coordinate_system,
-        xr_data=xr_data,
+    left, right, bottom, top = _get_bounds_meters(
+        location.x,
+        location.y,
+        location.coordinate_system,
+        roi_width_meters,
+        roi_height_meters,
+        xr_data,
     )
 
+    # Compare plain numpy arrays, which is much faster than comparing the DataArray coordinates
+    x = xr_data[xr_x_dim].values
+    y = xr_data[xr_y_dim].values
+
     # Do it off coordinates, not ID
     if dim_name is None:
         # Select a patch from the xarray data
-        x_mask = (left <= xr_data[xr_x_dim]) & (xr_data[xr_x_dim] <= right)
-        y_mask = (bottom <= xr_data[xr_y_dim]) & (xr_data[xr_y_dim] <= top)
+        x_mask = (left <= x) & (x <= right)
+        y_mask = (bottom <= y) & (y <= top)
         selected = xr_data.isel({xr_x_dim: x_mask, xr_y_dim: y_mask})
 
     else:
         # Select data in the region of interest and ID:
         # This also works for unstructured grids
 
-        id_mask = (
-            (left <= xr_data[xr_x_dim])
-            & (xr_data[xr_x_dim] <= right)
-            & (bottom <= xr_data[xr_y_dim])
-            & (xr_data[xr_y_dim] <= top)
-        )
-        selected = xr_data.isel({dim_name: id_mask})
+        id_mask = (left <= x) & (x <= right) & (bottom <= y) & (y <= top)
+        selected = xr_data.isel({dim_name: np.flatnonzero(id_mask)})
     return selected
 
 
+def select_spatial_slices_meters(
+    xr_data: Union[xr.Dataset, xr.DataArray],
+    locations: list[Location],
+    roi_width_meters: int,
+    roi_height_meters: int,
+    dim_name: str,
+) -> list[Union[xr.Dataset, xr.DataArray]]:
+    """
+    Select spatial slices around many locations by ID
+
+    This gives the same results as calling `select_spatial_slice_meters()` for each location, but
+    finds the IDs in the region of interest of all the locations at once.
+
+    Args:
+        xr_data: Xarray DataArray or Dataset to slice from
+        locations: Locations of interest
+        roi_height_meters: ROI height in meters
+        roi_width_meters: ROI width in meters
+        dim_name: Dimension name to select for ID
+    """
+    coordinate_systems = {location.coordinate_system for location in locations}
+    if len(coordinate_systems) != 1:
+        return [
+            select_spatial_slice_meters(
+                xr_data, location, roi_width_meters, roi_height_meters, dim_name
+            )
+            for location in locations
+        ]
+
+    _, xr_x_dim, xr_y_dim = spatial_coord_type(xr_data)
+
+    left, right, bottom, top = _get_bounds_meters(
+        np.array([location.x for location in locations]),
+        np.array([location.y for location in locations]),
+        coordinate_systems.pop(),
+        roi_width_meters,
+        roi_height_meters,
+        xr_data,
+    )
+
+    # Mask of shape (location, ID) of the IDs in each region of interest
+    x = xr_data[xr_x_dim].values
+    y = xr_data[xr_y_dim].values
+    id_masks = (
+        (left[:, np.newaxis] <= x)
+        & (x <= right[:, np.newaxis])
+        & (bottom[:, np.newaxis] <= y)
+        & (y <= top[:, np.newaxis])
+    )
+
+    return [xr_data.isel({dim_name: np.flatnonzero(id_mask)}) for id_mask in id_masks]
+
+
 # ------------------------------ datapipes for slicing ------------------------------
 
 
@@ -11,6 +11,9 @@ from torch.utils.data import IterDataPipe, functional_datapipe
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of t0 times to cache the time indexers of
+_MAX_CACHED_INDEXERS = 1024
+
 
 @functional_datapipe("select_time_slice_nwp")
 class SelectTimeSliceNWPIterDataPipe(IterDataPipe):
@@ -63,10 +66,66 @@ class SelectTimeSliceNWPIterDataPipe(IterDataPipe):
         assert 0 <= dropout_frac <= 1
         self._consider_dropout = (dropout_timedeltas is not None) and dropout_frac > 0
 
+        # Cache of the time indexers for each (t0, t0_available) pair. These only depend on the
+        # init times of the data, so the cache is reset if the init times change
+        self._indexer_cache = {}
+        self._cached_init_times = None
+
+    def _get_time_indexers(
+        self,
+        t0: pd.Timestamp,
+        t0_available: pd.Timestamp,
+        init_times: pd.DatetimeIndex,
+    ) -> tuple[pd.DatetimeIndex, np.ndarray, pd.TimedeltaIndex]:
+        """Find the target times, and the init time and step to select for each target time
+
+        Args:
+            t0: The t0 time
+            t0_available: The time at which the most recent available forecast was made
+            init_times: The sorted init times of the NWP data
+
+        Returns:
+            Tuple of the target times, selected init times and steps
+        """
+        if init_times is not self._cached_init_times:
+            self._indexer_cache = {}
+            self._cached_init_times = init_times
+
+        key = (t0, t0_available)
+        if key not in self._indexer_cache:
+            start_dt = (t0 - self.history_duration).ceil(self.sample_period_duration)
+            end_dt = (t0 + self.forecast_duration).ceil(self.sample_period_duration)
+
+            target_times = pd.date_range(start_dt, end_dt, freq=self.sample_period_duration)
+
+            # Forecasts made up to and including t0
+            num_available = np.searchsorted(init_times, t0_available, side="right")
+
+            # Find the most recent available init times for all target times
+            init_time_idx = (
+                np.searchsorted(init_times[:num_available], target_times, side="right") - 1
+            )
+            if (init_time_idx < 0).any():
+                raise KeyError(
+                    f"No init times available before target times {target_times[0]} with "
+                    f"t0_available={t0_available}"
+                )
+            selected_init_times = init_times.values[init_time_idx]
+
+            # Find the required steps for all target times
+            steps = target_times - selected_init_times
+
+            if len(self._indexer_cache) >= _MAX_CACHED_INDEXERS:
+                self._indexer_cache = {}
+            self._indexer_cache[key] = target_times, selected_init_times, steps
+
+        return self._indexer_cache[key]
+
     def __iter__(self) -> Union[xr.DataArray, xr.Dataset]:
         """Iterate through both datapipes and convert Xarray dataset"""
 
-        for t0, xr_data in self.t0_datapipe.zip(self.source_datapipe):
+        # Plain `zip` avoids the per-item overhead of wrapping the inputs in a Zipper datapipe
+        for t0, xr_data in zip(self.t0_datapipe, self.source_datapipe):
             # The accumatation and non-accumulation channels
             accum_channels = np.intersect1d(
                 xr_data[self.channel_dim_name].values, self.accum_channels
@@ -76,10 +135,6 @@ class SelectTimeSliceNWPIterDataPipe(IterDataPipe):
             )
 
             t0 = pd.Timestamp(t0)
-            start_dt = (t0 - self.history_duration).ceil(self.sample_period_duration)
-            end_dt = (t0 + self.forecast_duration).ceil(self.sample_period_duration)
-
-            target_times = pd.date_range(start_dt, end_dt, freq=self.sample_period_duration)
 
             # Maybe apply NWP dropout
             if self._consider_dropout and (np.random.uniform() < self.dropout_frac):
@@ -88,20 +143,10 @@ class SelectTimeSliceNWPIterDataPipe(IterDataPipe):
             else:
                 t0_available = t0
 
-            # Forecasts made up to and including t0
-            available_init_times = xr_data.init_time_utc.sel(
-                init_time_utc=slice(None, t0_available)
+            target_times, selected_init_times, steps = self._get_time_indexers(
+                t0, t0_available, xr_data.indexes["init_time_utc"]
             )
 
-            # Find the most recent available init times for all target times
-            selected_init_times = available_init_times.sel(
-                init_time_utc=target_times,
-                method="ffill",  # forward fill from init times to target times
-            ).values
-
-            # Find the required steps for all target times
-            steps = target_times - selected_init_times
-
             # We want one timestep for each target_time_hourly (obviously!) If we simply do
             # nwp.sel(init_time=init_times, step=steps) then we'll get the *product* of
             # init_times and steps, which is not what # we want! Instead, we use xarray's
@@ -415,8 +415,17 @@ def concat_xr_time_utc(gsp_dataarrays: List[xr.DataArray]):
 
     The `pvnet` model was also written to use a GSP/PV array which has historical and future
     and to split it out. These maintains that assumption.
+
+    Since the history and future are sliced from the same data, their coordinates other than time
+    are identical. So they are taken from the first array rather than being compared and aligned.
     """
-    return xr.concat(gsp_dataarrays, dim="time_utc")
+    return xr.concat(
+        gsp_dataarrays,
+        dim="time_utc",
+        coords="minimal",
+        compat="override",
+        join="override",
+    )
 
 
 def gsp_drop_national(x: Union[xr.DataArray, xr.Dataset]):
@@ -508,14 +517,28 @@ def fill_nans_in_arrays(
     return batch
 
 
+class _DatapipeFork(IterDataPipe):
+    """Placeholder for a fork of a datapipe which is filled in by `DatapipeKeyForker.close()`"""
+
+    def __init__(self):
+        """Placeholder for a fork of a datapipe which is filled in by `DatapipeKeyForker.close()`"""
+        self.datapipe = None
+
+    def __iter__(self):
+        if self.datapipe is None:
+            raise RuntimeError("DatapipeKeyForker.close() must be called before iterating forks")
+        yield from self.datapipe
+
+
 class DatapipeKeyForker:
     """ "Internal helper function to track forking of a datapipe."""
 
     def __init__(self, keys: List, datapipe: IterDataPipe):
         """Internal helper function to track forking of a datapipe.
 
-        As forks are returned, this object tracks the keys left and returns the final copy of the
-        datapipe when the last key is requested. This makes multiple forking easier and ensures
+        As forks are returned, this object tracks the keys left. When closed, the datapipe is
+        forked once into all the requested copies, rather than through a chain of 2-way forks which
+        every element would have to pass along. This makes multiple forking easier and ensures
         closure.
 
         Args:
@@ -524,10 +547,13 @@ class DatapipeKeyForker:
         """
         self.keys_left = keys
         self.datapipe = datapipe
+        self.forks: List[_DatapipeFork] = []
 
     def __call__(self, key):
         """ "Returns a fork of `self.datapipe` and tracks a the keys left to ensure closure.
 
+        The returned fork cannot be iterated until `close()` has been called.
+
         Args:
             key: key to remove from `self.keys_left`. If `key` is None then an extra copy is made
             without affecting `self.keys_left`.
@@ -536,15 +562,19 @@ class DatapipeKeyForker:
             raise ValueError(f"No keys left when requested key : {key}")
         if key is not None:
             self.keys_left.remove(key)
-        if len(self.keys_left) > 0:
-            self.datapipe, return_datapipe = self.datapipe.fork(2, buffer_size=5)
-        else:
-            return_datapipe = self.datapipe
+        return_datapipe = _DatapipeFork()
+        self.forks.append(return_datapipe)
         return return_datapipe
 
     def close(self):
-        """Asserts that the keys have all been used."""
+        """Asserts that the keys have all been used and creates the forks."""
         assert len(self.keys_left) == 0, self.keys_left
+        if len(self.forks) == 1:
+            self.forks[0].datapipe = self.datapipe
+        else:
+            datapipes = self.datapipe.fork(len(self.forks), buffer_size=5)
+            for fork, datapipe in zip(self.forks, datapipes):
+                fork.datapipe = datapipe
 
 
 def _get_datapipes_dict(
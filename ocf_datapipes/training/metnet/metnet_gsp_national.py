@@ -138,17 +138,17 @@ def metnet_national_datapipe(
     # Now combine in the MetNet format
     modalities = []
     if gsp_in_image and "hrv" in used_datapipes.keys():
-        sat_hrv_datapipe, sat_gsp_datapipe = sat_hrv_datapipe.fork(2)
+        sat_hrv_datapipe, sat_gsp_datapipe = sat_hrv_datapipe.fork(2, buffer_size=5)
         gsp_history = gsp_history.filter_gsp_ids(gsps_to_keep=[0]).create_gsp_image(
             image_datapipe=sat_gsp_datapipe
         )
     elif gsp_in_image and "sat" in used_datapipes.keys():
-        sat_datapipe, sat_gsp_datapipe = sat_datapipe.fork(2)
+        sat_datapipe, sat_gsp_datapipe = sat_datapipe.fork(2, buffer_size=5)
         gsp_history = gsp_history.filter_gsp_ids(gsps_to_keep=[0]).create_gsp_image(
             image_datapipe=sat_gsp_datapipe
         )
     elif gsp_in_image and "nwp" in used_datapipes.keys():
-        nwp_datapipe, nwp_gsp_datapipe = nwp_datapipe.fork(2)
+        nwp_datapipe, nwp_gsp_datapipe = nwp_datapipe.fork(2, buffer_size=5)
         gsp_history = gsp_history.filter_gsp_ids(gsps_to_keep=[0]).create_gsp_image(
             image_datapipe=nwp_gsp_datapipe, image_dim="osgb"
         )
@@ -110,7 +110,7 @@ def metnet_national_datapipe(
         sample_period_duration=timedelta(minutes=30),
         history_duration=timedelta(minutes=configuration.input_data.gsp.history_minutes),
     ).fork(
-        3
+        3, buffer_size=5
     )
     # get time periods
     # get contiguous time periods
@@ -133,7 +133,7 @@ def metnet_national_datapipe(
                 sample_period_duration=timedelta(hours=1),
                 history_duration=timedelta(minutes=configuration.input_data.nwp.history_minutes),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         nwp_time_periods_datapipe = nwp_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -155,7 +155,7 @@ def metnet_national_datapipe(
                     minutes=configuration.input_data.satellite.history_minutes
                 ),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         sat_time_periods_datapipe = sat_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -175,7 +175,7 @@ def metnet_national_datapipe(
                     minutes=configuration.input_data.hrvsatellite.history_minutes
                 ),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         sat_hrv_time_periods_datapipe = (
@@ -197,7 +197,7 @@ def metnet_national_datapipe(
                 sample_period_duration=timedelta(minutes=5),
                 history_duration=timedelta(minutes=configuration.input_data.pv.history_minutes),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         pv_time_periods_datapipe = pv_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -221,7 +221,7 @@ def metnet_national_datapipe(
     num_t0_datapipes = (
         1 + len(secondary_datapipes) if mode == "train" else 2 + len(secondary_datapipes)
     )
-    t0_datapipes = gsp_t0_datapipe.pick_t0_times().fork(num_t0_datapipes)
+    t0_datapipes = gsp_t0_datapipe.pick_t0_times().fork(num_t0_datapipes, buffer_size=100)
 
     # take pv time slices
     logger.debug("Take GSP time slices")
@@ -306,7 +306,7 @@ def metnet_national_datapipe(
     if use_topo:
         modalities.append(topo_datapipe)
 
-    gsp_datapipe, gsp_loc_datapipe = gsp_datapipe.fork(2)
+    gsp_datapipe, gsp_loc_datapipe = gsp_datapipe.fork(2, buffer_size=5)
 
     location_datapipe = PickLocations(gsp_loc_datapipe)
 
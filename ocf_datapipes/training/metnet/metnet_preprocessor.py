@@ -6,6 +6,7 @@ from typing import List
 import numpy as np
 import pvlib
 import xarray as xr
+from scipy.ndimage import map_coordinates
 from torch.utils.data import IterDataPipe, functional_datapipe
 
 from ocf_datapipes.select.select_spatial_slice import convert_coords_to_match_xarray
@@ -92,36 +93,26 @@ class PreProcessMetNetIterDataPipe(IterDataPipe):
     def __iter__(self) -> np.ndarray:
         for xr_datas, location in Zipper(Zipper(*self.source_datapipes), self.location_datapipe):
             # TODO Use the Lat/Long coordinates of the center array for the lat/lon stuff
-            # Do the resampling and cropping in parallel
-            xr_datas = run_with_threadpool(
+            # Do the resampling and cropping in parallel, with one task per data source making both
+            # its center and context crops
+            crops = run_with_threadpool(
                 zip(
-                    _bicycle(xr_datas),
+                    xr_datas,
                     itertools.repeat(location),
-                    itertools.chain.from_iterable(
-                        zip(
-                            itertools.repeat(self.center_width),
-                            itertools.repeat(self.context_width),
-                        )
-                    ),
-                    itertools.chain.from_iterable(
-                        zip(
-                            itertools.repeat(self.center_height),
-                            itertools.repeat(self.context_height),
-                        )
-                    ),
+                    itertools.repeat(self.center_width),
+                    itertools.repeat(self.center_height),
+                    itertools.repeat(self.context_width),
+                    itertools.repeat(self.context_height),
                     itertools.repeat(self.output_height_pixels),
                     itertools.repeat(self.output_width_pixels),
                 ),
                 _crop_and_resample_wrapper,
                 max_workers=8,
-                scheduled_tasks=int(len(xr_datas) * 2),  # One for center, one for context
+                scheduled_tasks=len(xr_datas),
             )
-            xr_datas = list(xr_datas)
-            # Output is then list of center, context, center, context, etc.
-            # So we need to split the list into two lists of the same length,
-            # one with centers, one with contexts
-            centers = xr_datas[::2]
-            contexts = xr_datas[1::2]
+            # Output is a list of (center, context) pairs, so split it into two lists of the same
+            # length, one with centers, one with contexts
+            centers, contexts = map(list, zip(*crops))
             # Now do the first one for the sun and other features
             xr_center = centers[0]
             _extra_time_dim = (
@@ -195,38 +186,55 @@ class PreProcessMetNetIterDataPipe(IterDataPipe):
 
 
 def _crop_and_resample_wrapper(args):
-    return _crop_and_resample(*args)
-
+    return _crop_and_resample_center_and_context(*args)
 
-def _bicycle(xr_datas):
-    for xr_data in xr_datas:
-        yield xr_data
-        yield xr_data
 
-
-def _crop_and_resample(
+def _crop_and_resample_center_and_context(
     xr_data: xr.Dataset,
     location,
+    center_width,
+    center_height,
     context_width,
     context_height,
     output_height_pixels,
     output_width_pixels,
 ):
-    xr_context: xr.Dataset = _get_spatial_crop(
+    center_bounds = _get_spatial_crop_bounds(
+        xr_data,
+        location=location,
+        roi_width_meters=center_width,
+        roi_height_meters=center_height,
+    )
+    context_bounds = _get_spatial_crop_bounds(
         xr_data,
         location=location,
         roi_width_meters=context_width,
         roi_height_meters=context_height,
     )
 
+    xr_context = _select_spatial_crop(xr_data, *context_bounds)
+
+    # If the center lies within the context, it can be cropped from the already cropped context
+    # rather than searching all the data again. This gives the same result
+    (left, right, bottom, top) = center_bounds
+    (context_left, context_right, context_bottom, context_top) = context_bounds
+    if (
+        context_left <= left
+        and right <= context_right
+        and context_bottom <= bottom
+        and top <= context_top
+    ):
+        xr_center = _select_spatial_crop(xr_context, *center_bounds)
+    else:
+        xr_center = _select_spatial_crop(xr_data, *center_bounds)
+
     # Resamples to the same number of pixels for both center and contexts
+    xr_center = _resample_to_pixel_size(xr_center, output_height_pixels, output_width_pixels)
     xr_context = _resample_to_pixel_size(xr_context, output_height_pixels, output_width_pixels)
-    return xr_context
-
+    return xr_center, xr_context
 
-def _get_spatial_crop(xr_data, location, roi_height_meters: int, roi_width_meters: int):
-    xr_coords, xr_x_dim, xr_y_dim = spatial_coord_type(xr_data)
 
+def _get_spatial_crop_bounds(xr_data, location, roi_height_meters: int, roi_width_meters: int):
     # Compute the index for left and right:
     half_height = roi_height_meters // 2
     half_width = roi_width_meters // 2
@@ -261,10 +269,17 @@ def _get_spatial_crop(xr_data, location, roi_height_meters: int, roi_width_meter
         from_coords=location.coordinate_system,
         xr_data=xr_data,
     )
+    return left, right, bottom, top
+
+
+def _select_spatial_crop(xr_data, left, right, bottom, top):
+    xr_coords, xr_x_dim, xr_y_dim = spatial_coord_type(xr_data)
 
     # Select a patch from the xarray data
-    x_mask = (left <= xr_data[xr_x_dim]) & (xr_data[xr_x_dim] <= right)
-    y_mask = (bottom <= xr_data[xr_y_dim]) & (xr_data[xr_y_dim] <= top)
+    x = xr_data[xr_x_dim].values
+    y = xr_data[xr_y_dim].values
+    x_mask = (left <= x) & (x <= right)
+    y_mask = (bottom <= y) & (y <= top)
     selected = xr_data.isel({xr_x_dim: x_mask, xr_y_dim: y_mask})
 
     return selected
@@ -272,29 +287,56 @@ def _get_spatial_crop(xr_data, location, roi_height_meters: int, roi_width_meter
 
 def _resample_to_pixel_size(xr_data, height_pixels, width_pixels) -> np.ndarray:
     if "x_geostationary" in xr_data.dims:
-        x_coords = xr_data["x_geostationary"].values
-        y_coords = xr_data["y_geostationary"].values
+        x_dim, y_dim = "x_geostationary", "y_geostationary"
     elif "x_osgb" in xr_data.dims:
-        x_coords = xr_data["x_osgb"].values
-        y_coords = xr_data["y_osgb"].values
+        x_dim, y_dim = "x_osgb", "y_osgb"
     else:
-        x_coords = xr_data["x"].values
-        y_coords = xr_data["y"].values
+        x_dim, y_dim = "x", "y"
+    x_coords = xr_data[x_dim].values
+    y_coords = xr_data[y_dim].values
     # Resample down to the number of pixels wanted
     x_coords = np.linspace(x_coords[0], x_coords[-1], num=width_pixels)
     y_coords = np.linspace(y_coords[0], y_coords[-1], num=height_pixels)
-    if "x_geostationary" in xr_data.dims:
-        xr_data = xr_data.interp(
-            x_geostationary=x_coords, y_geostationary=y_coords, method="linear"
-        )
-    elif "x_osgb" in xr_data.dims:
-        xr_data = xr_data.interp(x_osgb=x_coords, y_osgb=y_coords, method="linear")
-    else:
-        xr_data = xr_data.interp(x=x_coords, y=y_coords, method="linear")
+    if set(xr_data.dims) == {x_dim, y_dim}:
+        # Static maps, like the topographic data, can be sampled directly by pixel index
+        resampled = _resample_regular_grid(xr_data, x_dim, y_dim, x_coords, y_coords)
+        if resampled is not None:
+            return resampled
+    xr_data = xr_data.interp({x_dim: x_coords, y_dim: y_coords}, method="linear")
     # Extract just the data now
     return xr_data
 
 
+def _resample_regular_grid(xr_data, x_dim, y_dim, x_coords, y_coords):
+    """Linearly interpolate a 2D map at the given coords, or None if it isn't on a regular grid"""
+    x = xr_data[x_dim].values
+    y = xr_data[y_dim].values
+    if len(x) < 2 or len(y) < 2:
+        return None
+    # Other coords varying over the map would need interpolating too
+    if any(name not in xr_data.dims and c.ndim > 0 for name, c in xr_data.coords.items()):
+        return None
+    dx = x[1] - x[0]
+    dy = y[1] - y[0]
+    if not (np.allclose(np.diff(x), dx) and np.allclose(np.diff(y), dy)):
+        return None
+
+    # Fractional pixel index of each output pixel along each dimension, in the data's dim order
+    pixel_idxs = {x_dim: (x_coords - x[0]) / dx, y_dim: (y_coords - y[0]) / dy}
+    pixel_idxs = np.meshgrid(*[pixel_idxs[dim] for dim in xr_data.dims], indexing="ij")
+    values = map_coordinates(
+        np.asarray(xr_data.values, dtype=np.float64), pixel_idxs, order=1, mode="nearest"
+    )
+
+    return xr.DataArray(
+        values,
+        dims=xr_data.dims,
+        coords={**xr_data.coords, x_dim: x_coords, y_dim: y_coords},
+        attrs=xr_data.attrs,
+        name=xr_data.name,
+    )
+
+
 def _create_time_image(xr_data, time_dim: str, output_height_pixels: int, output_width_pixels: int):
     # Create trig decomposition of datetime values, tiled over output height and width
     datetimes = xr_data[time_dim].values
@@ -134,7 +134,7 @@ def metnet_national_datapipe(
             sample_period_duration=timedelta(minutes=30),
             history_duration=timedelta(minutes=configuration.input_data.gsp.history_minutes),
         )
-        .fork(3)
+        .fork(3, buffer_size=5)
     )
     # get time periods
     # get contiguous time periods
@@ -157,7 +157,7 @@ def metnet_national_datapipe(
                 sample_period_duration=timedelta(hours=1),
                 history_duration=timedelta(minutes=configuration.input_data.nwp.history_minutes),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         nwp_time_periods_datapipe = nwp_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -179,7 +179,7 @@ def metnet_national_datapipe(
                     minutes=configuration.input_data.satellite.history_minutes
                 ),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         sat_time_periods_datapipe = sat_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -199,7 +199,7 @@ def metnet_national_datapipe(
                     minutes=configuration.input_data.hrvsatellite.history_minutes
                 ),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         sat_hrv_time_periods_datapipe = (
@@ -221,7 +221,7 @@ def metnet_national_datapipe(
                 sample_period_duration=timedelta(minutes=5),
                 history_duration=timedelta(minutes=configuration.input_data.pv.history_minutes),
             )
-            .fork(2)
+            .fork(2, buffer_size=5)
         )
 
         pv_time_periods_datapipe = pv_time_periods_datapipe.find_contiguous_t0_time_periods(
@@ -247,7 +247,7 @@ def metnet_national_datapipe(
     )
     t0_datapipes = gsp_t0_datapipe.pick_t0_times(
         return_all_times=False  # if mode == "train" else True
-    ).fork(num_t0_datapipes)
+    ).fork(num_t0_datapipes, buffer_size=100)
 
     # take pv time slices
     logger.debug("Take GSP time slices")
@@ -316,7 +316,7 @@ def metnet_national_datapipe(
     if use_topo:
         modalities.append(topo_datapipe)
 
-    gsp_datapipe, gsp_loc_datapipe = gsp_datapipe.fork(2)
+    gsp_datapipe, gsp_loc_datapipe = gsp_datapipe.fork(2, buffer_size=5)
 
     location_datapipe = PickLocations(gsp_loc_datapipe)
 
@@ -110,15 +110,15 @@ def metnet_site_datapipe(
     pv_history = used_datapipes["pv"].normalize(normalize_fn=normalize_pv)
     pv_datapipe = used_datapipes["pv_future"].normalize(normalize_fn=normalize_pv)
     # Split into PV for target, and one for history
-    pv_datapipe, pv_loc_datapipe = pv_datapipe.fork(2)
-    pv_loc_datapipe, pv_id_datapipe = PickLocations(pv_loc_datapipe).fork(2)
+    pv_datapipe, pv_loc_datapipe = pv_datapipe.fork(2, buffer_size=5)
+    pv_loc_datapipe, pv_id_datapipe = PickLocations(pv_loc_datapipe).fork(2, buffer_size=5)
     pv_history = pv_history.select_id(pv_id_datapipe, data_source_name="pv")
 
     if "nwp" in used_datapipes.keys():
         # take nwp time slices
         logger.debug("Take NWP time slices")
         nwp_datapipe = used_datapipes["nwp"].normalize(mean=UKV_MEAN, std=UKV_STD)
-        pv_loc_datapipe, pv_nwp_image_loc_datapipe = pv_loc_datapipe.fork(2)
+        pv_loc_datapipe, pv_nwp_image_loc_datapipe = pv_loc_datapipe.fork(2, buffer_size=5)
         # context_size is the largest it would need
         nwp_datapipe = nwp_datapipe.select_spatial_slice_meters(
             pv_nwp_image_loc_datapipe,
@@ -135,7 +135,7 @@ def metnet_site_datapipe(
         logger.debug("Take Satellite time slices")
         # take sat time slices
         sat_datapipe = used_datapipes["sat"].normalize(mean=RSS_MEAN, std=RSS_STD)
-        pv_loc_datapipe, pv_sat_image_loc_datapipe = pv_loc_datapipe.fork(2)
+        pv_loc_datapipe, pv_sat_image_loc_datapipe = pv_loc_datapipe.fork(2, buffer_size=5)
         sat_datapipe = sat_datapipe.select_spatial_slice_meters(
             pv_sat_image_loc_datapipe,
             roi_height_meters=context_size_meters,
@@ -149,7 +149,7 @@ def metnet_site_datapipe(
     if "hrv" in used_datapipes.keys():
         logger.debug("Take HRV Satellite time slices")
         sat_hrv_datapipe = used_datapipes["hrv"].normalize(mean=RSS_MEAN, std=RSS_STD)
-        pv_loc_datapipe, pv_hrv_image_loc_datapipe = pv_loc_datapipe.fork(2)
+        pv_loc_datapipe, pv_hrv_image_loc_datapipe = pv_loc_datapipe.fork(2, buffer_size=5)
         sat_hrv_datapipe = sat_hrv_datapipe.select_spatial_slice_meters(
             pv_hrv_image_loc_datapipe,
             roi_height_meters=context_size_meters,
@@ -167,13 +167,13 @@ def metnet_site_datapipe(
     modalities = []
 
     if pv_in_image and "hrv" in used_datapipes.keys():
-        sat_hrv_datapipe, sat_pv_datapipe = sat_hrv_datapipe.fork(2)
+        sat_hrv_datapipe, sat_pv_datapipe = sat_hrv_datapipe.fork(2, buffer_size=5)
         pv_history = pv_history.create_pv_history_image(image_datapipe=sat_pv_datapipe)
     elif pv_in_image and "sat" in used_datapipes.keys():
-        sat_datapipe, sat_pv_datapipe = sat_datapipe.fork(2)
+        sat_datapipe, sat_pv_datapipe = sat_datapipe.fork(2, buffer_size=5)
         pv_history = pv_history.create_pv_history_image(image_datapipe=sat_pv_datapipe)
     elif pv_in_image and "nwp" in used_datapipes.keys():
-        nwp_datapipe, nwp_pv_datapipe = nwp_datapipe.fork(2)
+        nwp_datapipe, nwp_pv_datapipe = nwp_datapipe.fork(2, buffer_size=5)
         pv_history = pv_history.create_pv_history_image(
             image_datapipe=nwp_pv_datapipe, image_dim="osgb"
         )
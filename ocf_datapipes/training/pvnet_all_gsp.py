@@ -33,6 +33,7 @@ from ocf_datapipes.load.gsp.utils import GSPLocationLookup
 from ocf_datapipes.select.select_spatial_slice import (
     select_spatial_slice_meters,
     select_spatial_slice_pixels,
+    select_spatial_slices_meters,
 )
 from ocf_datapipes.training.common import (
     _get_datapipes_dict,
@@ -214,6 +215,17 @@ class SelectAllGSPSpatialSliceMetersIterDataPipe(IterDataPipe):
 
     def __iter__(self) -> Union[xr.DataArray, xr.Dataset]:
         for xr_data in self.source_datapipe:
+            if self.dim_name is not None:
+                # Find the IDs around all the locations at once
+                yield select_spatial_slices_meters(
+                    xr_data=xr_data,
+                    locations=self.locations,
+                    roi_width_meters=self.roi_width_meters,
+                    roi_height_meters=self.roi_height_meters,
+                    dim_name=self.dim_name,
+                )
+                continue
+
             loc_slices = []
 
             for location in self.locations:
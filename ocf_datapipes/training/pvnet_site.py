@@ -26,6 +26,7 @@ from ocf_datapipes.utils.consts import (
     RSS_MEAN,
     RSS_STD,
 )
+from ocf_datapipes.utils.future import ThreadPoolMapperIterDataPipe as ThreadPoolMapper
 from ocf_datapipes.utils.utils import (
     combine_to_single_dataset,
     flatten_nwp_source_dict,
@@ -143,51 +144,74 @@ class ConvertToNumpyBatchIterDataPipe(IterDataPipe):
         self,
         dataset_dict_dp: IterDataPipe,
         check_satellite_no_zeros: bool = False,
+        max_workers: int = 1,
     ):
-        """Init"""
+        """
+        Converts dictionaries of single sample datapipes to NumpyBatches
+
+        Args:
+            dataset_dict_dp: Datapipe of dictionaries of single sample datapipes
+            check_satellite_no_zeros: Not currently used
+            max_workers: Number of threads used to convert the samples. Each sample is converted
+                independently, so with more than one worker several samples are converted at once.
+                The samples are still yielded in order.
+        """
         super().__init__()
         self.dataset_dict_dp = dataset_dict_dp
         self.check_satellite_no_zeros = check_satellite_no_zeros
+        self.max_workers = max_workers
 
     def __iter__(self):
         """Iter"""
-        for datapipes_dict in self.dataset_dict_dp:
-            # Spatially slice, normalize, and convert data to numpy arrays
-            numpy_modalities = []
-
-            if "nwp" in datapipes_dict:
-                # Combine the NWPs into NumpyBatch
-                nwp_numpy_modalities = dict()
-                for nwp_key, nwp_datapipe in datapipes_dict["nwp"].items():
-                    nwp_numpy_modalities[nwp_key] = nwp_datapipe.convert_nwp_to_numpy_batch()
-
-                nwp_numpy_modalities = MergeNWPNumpyModalities(nwp_numpy_modalities)
-                numpy_modalities.append(nwp_numpy_modalities)
-
-            if "sat" in datapipes_dict:
-                numpy_modalities.append(datapipes_dict["sat"].convert_satellite_to_numpy_batch())
-            if "pv" in datapipes_dict:
-                numpy_modalities.append(datapipes_dict["pv"].convert_pv_to_numpy_batch())
-            if "gsp" in datapipes_dict:
-                numpy_modalities.append(datapipes_dict["gsp"].convert_gsp_to_numpy_batch())
-            if "sensor" in datapipes_dict:
-                numpy_modalities.append(datapipes_dict["sensor"].convert_sensor_to_numpy_batch())
-            if "wind" in datapipes_dict:
-                numpy_modalities.append(datapipes_dict["wind"].convert_wind_to_numpy_batch())
-
-            logger.debug("Combine all the data sources")
-            combined_datapipe = MergeNumpyModalities(numpy_modalities).add_sun_position(
-                modality_name="pv"
+        if self.max_workers > 1:
+            yield from ThreadPoolMapper(
+                self.dataset_dict_dp,
+                self._convert_to_numpy_batch,
+                max_workers=self.max_workers,
+                scheduled_tasks=2 * self.max_workers,
             )
+        else:
+            for datapipes_dict in self.dataset_dict_dp:
+                yield self._convert_to_numpy_batch(datapipes_dict)
+
+    def _convert_to_numpy_batch(self, datapipes_dict):
+        """Convert a single sample to a NumpyBatch"""
+        # Spatially slice, normalize, and convert data to numpy arrays
+        numpy_modalities = []
+
+        if "nwp" in datapipes_dict:
+            # Combine the NWPs into NumpyBatch
+            nwp_numpy_modalities = dict()
+            for nwp_key, nwp_datapipe in datapipes_dict["nwp"].items():
+                nwp_numpy_modalities[nwp_key] = nwp_datapipe.convert_nwp_to_numpy_batch()
+
+            nwp_numpy_modalities = MergeNWPNumpyModalities(nwp_numpy_modalities)
+            numpy_modalities.append(nwp_numpy_modalities)
+
+        if "sat" in datapipes_dict:
+            numpy_modalities.append(datapipes_dict["sat"].convert_satellite_to_numpy_batch())
+        if "pv" in datapipes_dict:
+            numpy_modalities.append(datapipes_dict["pv"].convert_pv_to_numpy_batch())
+        if "gsp" in datapipes_dict:
+            numpy_modalities.append(datapipes_dict["gsp"].convert_gsp_to_numpy_batch())
+        if "sensor" in datapipes_dict:
+            numpy_modalities.append(datapipes_dict["sensor"].convert_sensor_to_numpy_batch())
+        if "wind" in datapipes_dict:
+            numpy_modalities.append(datapipes_dict["wind"].convert_wind_to_numpy_batch())
+
+        logger.debug("Combine all the data sources")
+        combined_datapipe = MergeNumpyModalities(numpy_modalities).add_sun_position(
+            modality_name="pv"
+        )
 
-            logger.info("Filtering out samples with no data")
-            # if self.check_satellite_no_zeros:
-            # in production we don't want any nans in the satellite data
-            #    combined_datapipe = combined_datapipe.map(check_nans_in_satellite_data)
+        logger.info("Filtering out samples with no data")
+        # if self.check_satellite_no_zeros:
+        # in production we don't want any nans in the satellite data
+        #    combined_datapipe = combined_datapipe.map(check_nans_in_satellite_data)
 
-            combined_datapipe = combined_datapipe.map(fill_nans_in_arrays)
+        combined_datapipe = combined_datapipe.map(fill_nans_in_arrays)
 
-            yield next(iter(combined_datapipe))
+        return next(iter(combined_datapipe))
 
 
 def minutes(num_mins: int):
@@ -378,6 +402,7 @@ def split_dataset_dict_dp(element):
 def pvnet_site_netcdf_datapipe(
     keys: List[str],
     filenames: List[str],
+    max_workers: int = 4,
 ) -> IterDataPipe:
     """
     Load the saved Datapipes from pvnet site, and transform to numpy batch
@@ -385,6 +410,7 @@ def pvnet_site_netcdf_datapipe(
     Args:
         keys: List of keys to extract from the single NetCDF files
         filenames: List of NetCDF files to load
+        max_workers: Number of threads used to convert the samples to numpy batches
 
     Returns:
         Datapipe that transforms the NetCDF files to numpy batch
@@ -395,7 +421,7 @@ def pvnet_site_netcdf_datapipe(
         filenames=filenames,
         keys=keys,
     ).map(split_dataset_dict_dp)
-    datapipe = datapipe_dict_dp.pvnet_site_convert_to_numpy_batch()
+    datapipe = datapipe_dict_dp.pvnet_site_convert_to_numpy_batch(max_workers=max_workers)
 
     return datapipe
 
@@ -11,6 +11,13 @@ from ocf_datapipes.batch import BatchKey, NumpyBatch, NWPBatchKey, NWPNumpyBatch
 
 logger = logging.getLogger(__name__)
 
+# Map from each coordinate key which gets Fourier features to the key to store them under
+_FOURIER_KEYS = {
+    key: type(key)[f"{key.name}_fourier"]
+    for key in list(BatchKey) + list(NWPBatchKey)
+    if key.name.endswith(("x_osgb", "y_osgb", "time_utc"))
+}
+
 
 @functional_datapipe("add_fourier_space_time")
 class AddFourierSpaceTimeIterDataPipe(IterDataPipe):
@@ -69,20 +76,12 @@ def _add_spatial_and_temporal_fourier_features(
     n_fourier_features_per_dim: int,
 ) -> Union[NumpyBatch, NWPNumpyBatch]:
     """Adds fourier encodings in place to batch dict"""
-    for key in list(batch.keys()):
-        if key.name.endswith(("x_osgb", "y_osgb", "time_utc")):
-            if isinstance(key, BatchKey):
-                fourier_key = BatchKey[f"{key.name}_fourier"]
-            elif isinstance(key, NWPBatchKey):
-                fourier_key = NWPBatchKey[f"{key.name}_fourier"]
-            else:
-                raise ValueError(f"Unregognized key: {key}")
-
-            normalized_coords = normalize_coords(batch[key])
-
-            batch[fourier_key] = compute_fourier_features(
-                normalized_coords, n_fourier_features=n_fourier_features_per_dim
-            )
+    for key in [key for key in batch if key in _FOURIER_KEYS]:
+        normalized_coords = normalize_coords(batch[key])
+
+        batch[_FOURIER_KEYS[key]] = compute_fourier_features(
+            normalized_coords, n_fourier_features=n_fourier_features_per_dim
+        )
     return
 
 
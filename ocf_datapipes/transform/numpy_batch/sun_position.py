@@ -46,6 +46,39 @@ def _get_azimuth_and_elevation(lon, lat, dt, must_be_finite):
         return azimuth, elevation
 
 
+def _get_azimuth_and_elevation_batch(lons, lats, times, must_be_finite):
+    """Get the Sun's azimuth and elevation for all examples in a single solar position calculation
+
+    Args:
+        lons: Longitude of each example. Shape: (example,)
+        lats: Latitude of each example. Shape: (example,)
+        times: Times of each example. Shape: (example, time)
+        must_be_finite: Whether to raise an error for non-finite locations rather than returning
+            NaNs for those examples
+    """
+    azimuth = np.full(times.shape, fill_value=np.nan, dtype=np.float32)
+    elevation = np.full(times.shape, fill_value=np.nan, dtype=np.float32)
+
+    is_finite = np.isfinite(lons) & np.isfinite(lats)
+    if must_be_finite and not is_finite.all():
+        example_idx = np.argmin(is_finite)
+        raise ValueError(f"Non-finite (lon, lat) = ({lons[example_idx]}, {lats[example_idx]}")
+
+    if is_finite.any():
+        # pvlib broadcasts array locations against the times so flatten the examples together
+        n_times = times.shape[1]
+        flat_azimuth, flat_elevation = _get_azimuth_and_elevation(
+            np.repeat(lons[is_finite], n_times),
+            np.repeat(lats[is_finite], n_times),
+            times[is_finite].ravel(),
+            must_be_finite,
+        )
+        azimuth[is_finite] = np.asarray(flat_azimuth).reshape(-1, n_times)
+        elevation[is_finite] = np.asarray(flat_elevation).reshape(-1, n_times)
+
+    return azimuth, elevation
+
+
 @functional_datapipe("add_sun_position")
 class AddSunPositionIterDataPipe(IterDataPipe):
     """Adds the sun position to the NumpyBatch"""
@@ -156,14 +189,9 @@ class AddSunPositionIterDataPipe(IterDataPipe):
                 assert lons.shape == (time_utc.shape[0],)
                 assert lats.shape == (time_utc.shape[0],)
 
-                azimuth = np.full_like(time_utc, fill_value=np.nan).astype(np.float32)
-                elevation = np.full_like(time_utc, fill_value=np.nan).astype(np.float32)
-
-                # Loop round each example to get the Sun's elevation and azimuth
-                for example_idx, (lon, lat, dt) in enumerate(zip(lons, lats, times)):
-                    azimuth[example_idx], elevation[example_idx] = _get_azimuth_and_elevation(
-                        lon, lat, dt, must_be_finite
-                    )
+                azimuth, elevation = _get_azimuth_and_elevation_batch(
+                    lons, lats, times, must_be_finite
+                )
             else:
                 assert (isinstance(lons, np.ndarray) and lons.shape == ()) or isinstance(
                     lons, float
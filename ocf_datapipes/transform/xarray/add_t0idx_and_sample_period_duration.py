@@ -40,9 +40,8 @@ class AddT0IdxAndSamplePeriodDurationIterDataPipe(IterDataPipe):
         """Adds the two attributes to the xarray objects and returns them"""
         for xr_data in self.source_datapipe:
             logger.debug(
-                f"Adding t0 and sample_period_duration to xarray for data source {self.name}"
+                "Adding t0 and sample_period_duration to xarray for data source %s", self.name
             )
             xr_data.attrs["t0_idx"] = self.t0_idx
             xr_data.attrs["sample_period_duration"] = self.sample_period_duration
-            logger.debug("done at t0 idx")
             yield xr_data
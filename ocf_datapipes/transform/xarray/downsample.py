@@ -1,8 +1,27 @@
 """Downsample Xarray datasets Datapipe"""
 
+from typing import Union
+
+import numpy as np
+import xarray as xr
 from torch.utils.data import IterDataPipe, functional_datapipe
 
 
+def _is_loaded_without_nans(xr_data: Union[xr.Dataset, xr.DataArray]) -> bool:
+    """Check whether all the data is in-memory floating point data without any NaNs"""
+    if isinstance(xr_data, xr.DataArray):
+        data_arrays = [xr_data]
+    else:
+        data_arrays = list(xr_data.data_vars.values())
+
+    return all(
+        isinstance(da.data, np.ndarray)
+        and np.issubdtype(da.dtype, np.floating)
+        and not np.isnan(da.data).any()
+        for da in data_arrays
+    )
+
+
 @functional_datapipe("downsample")
 class DownsampleIterDataPipe(IterDataPipe):
     """Downsample Xarray dataset with coarsen"""
@@ -34,7 +53,13 @@ class DownsampleIterDataPipe(IterDataPipe):
     def __iter__(self):
         """Coarsen the data on the specified dimensions"""
         for xr_data in self.source_datapipe:
-            yield xr_data.coarsen(
+            coarsened = xr_data.coarsen(
                 {self.y_dim_name: self.y_coarsen, self.x_dim_name: self.x_coarsen},
                 boundary="trim",
-            ).mean()
+            )
+            if _is_loaded_without_nans(xr_data):
+                # Without NaNs a plain mean gives the same result as the (much slower) NaN-skipping
+                # mean. Lazy data is left to the default so it isn't computed here
+                yield coarsened.reduce(np.mean)
+            else:
+                yield coarsened.mean()
@@ -58,11 +58,10 @@ class CreateGSPImageIterDataPipe(IterDataPipe):
                 ),
                 dtype=np.float32,
             )
-            for i, gsp_system_id in enumerate(gsp_systems_xr["gsp_id"]):
+            for gsp_system_id in gsp_systems_xr["gsp_id"]:
                 gsp_system = gsp_systems_xr.sel(gsp_id=gsp_system_id)
-                for time_step in range(len(gsp_system.time_utc.values)):
-                    # Now go by the timestep to create cube of GSP data
-                    pv_image[time_step:, :] = gsp_system.isel(time_utc=time_step).values
+                # Broadcast the GSP value at each timestep across the whole image
+                pv_image[:] = gsp_system.values[:, np.newaxis, np.newaxis]
 
             pv_image = np.nan_to_num(pv_image)
 
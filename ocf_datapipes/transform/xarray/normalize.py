@@ -10,6 +10,13 @@ from torch.utils.data import IterDataPipe, functional_datapipe
 logger = logging.getLogger(__name__)
 
 
+def _astype(x, dtype):
+    """Cast an xarray object, array, or scalar to the given dtype"""
+    if hasattr(x, "astype"):
+        return x.astype(dtype)
+    return np.asarray(x, dtype=dtype)
+
+
 @functional_datapipe("normalize")
 class NormalizeIterDataPipe(IterDataPipe):
     """Normalize the data in various methods"""
@@ -22,6 +29,7 @@ class NormalizeIterDataPipe(IterDataPipe):
         max_value: Optional[Union[int, float]] = None,
         calculate_mean_std_from_example: bool = False,
         normalize_fn: Optional[Callable] = None,
+        out_dtype: Optional[np.dtype] = np.float32,
     ):
         """
         Normalize the data with either given mean/std,
@@ -37,13 +45,22 @@ class NormalizeIterDataPipe(IterDataPipe):
             calculate_mean_std_from_example: Whether to calculate the
                 mean/std from the input data or not
             normalize_fn: Callable function to apply to the data to normalize it
+            out_dtype: Dtype of the normalized data. If None, the dtype is left as it is
         """
+        if out_dtype is not None:
+            # Store the stats in the output dtype so they don't upcast the data
+            mean = None if mean is None else _astype(mean, out_dtype)
+            std = None if std is None else _astype(std, out_dtype)
+
         self.source_datapipe = source_datapipe
         self.mean = mean
         self.std = std
         self.max_value = max_value
         self.calculate_mean_std_from_example = calculate_mean_std_from_example
         self.normalize_fn = normalize_fn
+        self.out_dtype = out_dtype
+        # Multiplying by the reciprocal is cheaper than dividing every element by the std
+        self._inv_std = None if std is None else 1 / std
 
     def __iter__(self) -> Union[xr.Dataset, xr.DataArray]:
         """Normalize the data depending on the init arguments"""
@@ -53,14 +70,14 @@ class NormalizeIterDataPipe(IterDataPipe):
         for xr_data in self.source_datapipe:
             assert xr_data is not None
             if (self.mean is not None) and (self.std is not None):
-                xr_data = xr_data - self.mean
-                xr_data = xr_data / self.std
+                xr_data = (xr_data - self.mean) * self._inv_std
             elif self.max_value is not None:
                 xr_data = xr_data / self.max_value
             elif self.calculate_mean_std_from_example:
                 # For Topo data for example
-                xr_data -= xr_data.mean().item()
-                xr_data /= xr_data.std().item()
+                # Accumulate the stats in float64 for accuracy
+                xr_data -= xr_data.mean(dtype=np.float64).item()
+                xr_data /= xr_data.std(dtype=np.float64).item()
             else:
                 try:
                     logger.debug(f"Normalizing by {self.normalize_fn}")
@@ -71,5 +88,8 @@ class NormalizeIterDataPipe(IterDataPipe):
                     logger.debug(xr_data_un_normalized)
                     raise e
 
+            if self.out_dtype is not None:
+                xr_data = xr_data.astype(self.out_dtype, copy=False)
+
             logger.debug("Normalizing data:done")
             yield xr_data
@@ -3,7 +3,6 @@
 import logging
 
 import numpy as np
-import xarray as xr
 from torch.utils.data import IterDataPipe, functional_datapipe
 
 logger = logging.getLogger(__name__)
@@ -28,33 +27,34 @@ class EnsureNPVSystemsPerExampleIterDataPipe(IterDataPipe):
 
     def __iter__(self):
         for xr_data in self.source_datapipe:
-            if len(xr_data.pv_system_id) > self.n_pv_systems_per_example:
+            n_pv_systems = xr_data.sizes["pv_system_id"]
+            if n_pv_systems > self.n_pv_systems_per_example:
                 logger.debug(f"Reducing PV systems to  {self.n_pv_systems_per_example}")
                 # More PV systems are available than we need. Reduce by randomly sampling:
-                subset_of_pv_system_ids = self.rng.choice(
-                    xr_data.pv_system_id,
+                subset_idx = self.rng.choice(
+                    n_pv_systems,
                     size=self.n_pv_systems_per_example,
                     replace=False,
                 )
-                xr_data = xr_data.sel(pv_system_id=subset_of_pv_system_ids)
-            elif len(xr_data.pv_system_id) < self.n_pv_systems_per_example:
+                xr_data = xr_data.isel(pv_system_id=subset_idx)
+            elif n_pv_systems < self.n_pv_systems_per_example:
                 logger.debug("Padding out PV systems")
                 # If we just used `choice(replace=True)` then there's a high chance
                 # that the output won't include every available PV system but instead
                 # will repeat some PV systems at the expense of leaving some on the table.
                 # TODO: Don't repeat PV systems. Pad with NaNs and mask the loss. Issue #73.
-                assert len(xr_data.pv_system_id) > 0, (
+                assert n_pv_systems > 0, (
                     "There are no PV systems at all. " "We need at least one in an example"
                 )
-                n_random_pv_systems = self.n_pv_systems_per_example - len(xr_data.pv_system_id)
-                allow_replacement = n_random_pv_systems > len(xr_data.pv_system_id)
-                random_pv_system_ids = self.rng.choice(
-                    xr_data.pv_system_id,
+                n_random_pv_systems = self.n_pv_systems_per_example - n_pv_systems
+                allow_replacement = n_random_pv_systems > n_pv_systems
+                random_idx = self.rng.choice(
+                    n_pv_systems,
                     size=n_random_pv_systems,
                     replace=allow_replacement,
                 )
-                xr_data = xr.concat(
-                    (xr_data, xr_data.sel(pv_system_id=random_pv_system_ids)),
-                    dim="pv_system_id",
+                # Select all the PV systems followed by the random ones in a single indexing step
+                xr_data = xr_data.isel(
+                    pv_system_id=np.concatenate([np.arange(n_pv_systems), random_idx])
                 )
             yield xr_data
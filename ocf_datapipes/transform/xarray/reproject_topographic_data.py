@@ -25,22 +25,28 @@ class ReprojectTopographyIterDataPipe(IterDataPipe):
         """
         Reproject topo data to OSGB
 
+        The topographic data is static, so it is only reprojected the first time this datapipe is
+        iterated over. Later iterations reuse the result.
+
         Args:
             topo_datapipe: Datapipe emitting topographic data
         """
         self.topo_datapipe = topo_datapipe
+        self._reprojected_topo = None
 
     def __iter__(self) -> xr.DataArray:
         """Reproject topographic data"""
-        for topo in self.topo_datapipe:
+        if self._reprojected_topo is None:
+            topo = next(iter(self.topo_datapipe))
+
             # Select Western Europe:
             topo = topo.sel(x_osgb=slice(-300_000, 1_500_000), y_osgb=slice(1_300_000, -800_000))
 
             topo = reproject_topo_data_from_osgb_to_geostationary(topo)
-            topo = topo.fillna(0)
+            self._reprojected_topo = topo.fillna(0)
 
-            while True:
-                yield topo
+        while True:
+            yield self._reprojected_topo
 
 
 def reproject_topo_data_from_osgb_to_geostationary(topo: xr.DataArray) -> xr.DataArray:
@@ -1,6 +1,7 @@
 """Various utilities for use in datapipes"""
 
 from .datapipes import LengthSetterIterDataPipe as LengthSetter
+from .datapipes import PrefetcherIterDataPipe as Prefetcher
 from .datapipes import RepeaterIterDataPipe as Repeater
 from .datapipes import UnZipperIterDataPipe as UnZipper
 from .datapipes import ZipperIterDataPipe as Zipper
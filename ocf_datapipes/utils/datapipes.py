@@ -1,5 +1,7 @@
 """Datapipes from TorchData that have been copied in for use with core PyTorch Datapipes"""
 
+import queue
+import threading
 from typing import Iterator, List, Optional, Sequence, Sized, Tuple, TypeVar
 
 from torch.utils.data import IterDataPipe, functional_datapipe
@@ -42,9 +44,7 @@ class ZipperIterDataPipe(IterDataPipe[Tuple[T_co]]):
 
     def __iter__(self) -> Iterator[Tuple[T_co]]:
         """Iter"""
-        iterators = [iter(datapipe) for datapipe in self.datapipes]
-        for data in zip(*iterators):
-            yield data
+        yield from zip(*self.datapipes)
 
     def __len__(self) -> int:
         """Len"""
@@ -295,3 +295,81 @@ class HeaderIterDataPipe(IterDataPipe[T_co]):
                     "The length of this HeaderIterDataPipe cannot be determined."
                 ) from error
             return self.limit
+
+
+@functional_datapipe("prefetch")
+class PrefetcherIterDataPipe(IterDataPipe[T_co]):
+    r"""
+    Prefetcher
+
+    Iterates over the source DataPipe in a background thread, keeping up to ``buffer_size``
+    elements ready ahead of the consumer (functional name: ``prefetch``). This lets the loading
+    and processing of the next elements overlap with whatever is done with the current one.
+
+    Note:
+        The source DataPipe is iterated in a separate thread, so it must not be iterated
+        concurrently anywhere else. In particular, don't prefetch several children of the same
+        ``fork()`` and then iterate them together since the forker is not thread-safe.
+
+    Args:
+        source_datapipe: the DataPipe from which elements will be prefetched
+        buffer_size: the maximum number of elements to prefetch
+
+    Example:
+        >>> from torchdata.datapipes.iter import IterableWrapper
+        >>> dp = IterableWrapper(range(5)).prefetch(2)
+        >>> list(dp)
+        [0, 1, 2, 3, 4]
+    """
+
+    _END = object()
+
+    def __init__(self, source_datapipe: IterDataPipe[T_co], buffer_size: int = 10) -> None:
+        """Init"""
+        self.source_datapipe: IterDataPipe[T_co] = source_datapipe
+        if buffer_size <= 0:
+            raise ValueError(f"The buffer size must be > 0, got {buffer_size}")
+        self.buffer_size: int = buffer_size
+
+    def __iter__(self) -> Iterator[T_co]:
+        """Iter"""
+        buffer: queue.Queue = queue.Queue(maxsize=self.buffer_size)
+        stop_event = threading.Event()
+
+        def put(item) -> bool:
+            # Wait for space in the buffer, unless the consumer has stopped iterating
+            while not stop_event.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for element in self.source_datapipe:
+                    if not put((element, None)):
+                        return
+            except Exception as error:
+                put((self._END, error))
+            else:
+                put((self._END, None))
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                element, error = buffer.get()
+                if element is self._END:
+                    if error is not None:
+                        raise error
+                    return
+                yield element
+        finally:
+            stop_event.set()
+
+    def __len__(self) -> int:
+        """Len"""
+        return len(self.source_datapipe)
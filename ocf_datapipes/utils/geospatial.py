@@ -226,16 +226,25 @@ def move_lon_lat_by_meters(lon, lat, meters_east, meters_north):
     Move a (lon, lat) by a certain number of meters north and east
 
     Args:
-        lon: longitude
-        lat: latitude
+        lon: longitude, float or array-like
+        lat: latitude, float or array-like
         meters_east: number of meters to move east
         meters_north: number of meters to move north
 
     Returns:
         tuple of lon, lat
     """
-    new_lon = _geod.fwd(lons=lon, lats=lat, az=90, dist=meters_east)[0]
-    new_lat = _geod.fwd(lons=lon, lats=lat, az=0, dist=meters_north)[1]
+    az_east, az_north = 90, 0
+    if np.ndim(lon) > 0:
+        # pyproj requires all the array arguments to have the same shape
+        lon, lat, meters_east, meters_north = np.broadcast_arrays(
+            lon, lat, meters_east, meters_north
+        )
+        az_east = np.full(lon.shape, az_east)
+        az_north = np.full(lon.shape, az_north)
+
+    new_lon = _geod.fwd(lons=lon, lats=lat, az=az_east, dist=meters_east)[0]
+    new_lat = _geod.fwd(lons=lon, lats=lat, az=az_north, dist=meters_north)[1]
     return new_lon, new_lat
 
 
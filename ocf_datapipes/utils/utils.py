@@ -12,6 +12,13 @@ import xarray as xr
 from pandas.core.dtypes.common import is_datetime64_dtype
 from pathy import Pathy
 
+try:
+    import numba
+
+    _has_numba = True
+except ImportError:
+    _has_numba = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,15 +34,39 @@ def datetime64_to_float(datetimes: np.ndarray, dtype=np.float64) -> np.ndarray:
         Converted datetimes to floats
     """
     nums = datetimes.astype("datetime64[s]").astype(dtype)
-    mask = np.isfinite(datetimes)
-    return np.where(mask, nums, np.nan)
+    # NaT values cast to a large negative number, so overwrite these with NaN in-place. Most
+    # arrays contain no NaTs, in which case this is skipped
+    nat_mask = np.isnat(datetimes)
+    if nat_mask.any():
+        nums[nat_mask] = np.nan
+    return nums
+
+
+if _has_numba:
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _is_sorted_scan(array):
+        """Scan the array in order, stopping at the first out-of-order pair"""
+        for i in range(1, array.shape[0]):
+            # Written as `not <=` so that NaNs count as unsorted, as with the numpy version
+            if not array[i - 1] <= array[i]:
+                return False
+        return True
 
 
 def is_sorted(array: np.ndarray) -> bool:
     """Return True if array is sorted in ascending order."""
-    # Adapted from https://stackoverflow.com/a/47004507/732596
     if len(array) == 0:
         return False
+    if (
+        _has_numba
+        and isinstance(array, np.ndarray)
+        and array.ndim == 1
+        and array.dtype.kind in "iuf"
+    ):
+        # Exit early on the first unsorted pair without allocating any temporary arrays
+        return bool(_is_sorted_scan(array))
+    # Adapted from https://stackoverflow.com/a/47004507/732596
     return np.all(array[:-1] <= array[1:])
 
 
@@ -1,3 +1,5 @@
+from concurrent import futures
+
 import pytest
 import numpy as np
 from torch.utils.data.datapipes.iter import IterableWrapper
@@ -5,7 +7,9 @@ from torch.utils.data.datapipes.iter import IterableWrapper
 from ocf_datapipes.batch import BatchKey, NWPBatchKey, NumpyBatch, NWPNumpyBatch
 
 
+import ocf_datapipes.batch.merge_numpy_examples_to_batch as merge_numpy_examples_to_batch
 from ocf_datapipes.batch.merge_numpy_examples_to_batch import (
+    stack_np_examples_into_batch,
     unstack_np_batch_into_examples,
     MergeNumpyBatchIterDataPipe,
     MergeNumpyExamplesToBatchIterDataPipe,
@@ -62,6 +66,46 @@ def test_merge_numpy_batch(numpy_sample_datapipe):
         assert nwp_batch[NWPBatchKey.nwp_channel_names] == ["a", "b"]
 
 
+def test_merge_numpy_batch_reuse_buffers(numpy_sample_datapipe):
+    dp = MergeNumpyBatchIterDataPipe(numpy_sample_datapipe.batch(4), reuse_buffers=True)
+    dp_iter = iter(dp)
+
+    first_sat_data = None
+    for i in range(2):
+        batch = next(dp_iter)
+        assert (
+            batch[BatchKey.satellite_actual][:, 0, 0, 0, 0] == np.arange(4 * i, 4 * (i + 1))
+        ).all()
+        assert batch[BatchKey.gsp_t0_idx] == 4
+
+        nwp_batch = batch[BatchKey.nwp]["ukv"]
+        assert (nwp_batch[NWPBatchKey.nwp][:, 0, 0, 0, 0] == np.arange(4 * i, 4 * (i + 1))).all()
+        assert nwp_batch[NWPBatchKey.nwp_channel_names] == ["a", "b"]
+
+        # The same output array should be used for each batch
+        if first_sat_data is None:
+            first_sat_data = batch[BatchKey.satellite_actual]
+        assert batch[BatchKey.satellite_actual] is first_sat_data
+
+
+def test_merge_numpy_batch_double_buffers(numpy_sample_datapipe):
+    dp = MergeNumpyBatchIterDataPipe(
+        numpy_sample_datapipe.batch(2), reuse_buffers=True, n_buffers=2
+    )
+    batches = list(dp)
+
+    sat_data = [batch[BatchKey.satellite_actual] for batch in batches]
+
+    # Consecutive batches should use different output arrays, cycling between two sets
+    assert sat_data[1] is not sat_data[0]
+    assert sat_data[2] is sat_data[0]
+    assert sat_data[3] is sat_data[1]
+
+    # The last two batches should not have been overwritten
+    for i in (2, 3):
+        assert (sat_data[i][:, 0, 0, 0, 0] == np.arange(2 * i, 2 * (i + 1))).all()
+
+
 def test_merge_numpy_examples_to_batch(numpy_sample_datapipe):
     dp = MergeNumpyExamplesToBatchIterDataPipe(numpy_sample_datapipe, n_examples_per_batch=4)
     dp_iter = iter(dp)
@@ -91,3 +135,63 @@ def test_unstack_np_batch_into_examples(numpy_sample_datapipe):
         nwp_sample = sample[BatchKey.nwp]["ukv"]
         assert nwp_sample[NWPBatchKey.nwp][0, 0, 0, 0] == i
         assert nwp_sample[NWPBatchKey.nwp_channel_names] == ["a", "b"]
+
+
+def test_unstack_np_batch_without_nwp(numpy_sample_datapipe):
+    dp = MergeNumpyBatchIterDataPipe(
+        numpy_sample_datapipe.map(
+            lambda x: {k: v for k, v in x.items() if k != BatchKey.nwp}
+        ).batch(4)
+    )
+
+    batch = next(iter(dp))
+    assert BatchKey.nwp not in batch
+
+    samples = unstack_np_batch_into_examples(batch)
+    assert len(samples) == 4
+
+    for i, sample in enumerate(samples):
+        assert sample[BatchKey.satellite_actual][0, 0, 0, 0] == i
+        assert BatchKey.nwp not in sample
+
+
+def test_unstack_np_batch_nwp_only(numpy_sample_datapipe):
+    dp = MergeNumpyBatchIterDataPipe(
+        numpy_sample_datapipe.map(lambda x: {BatchKey.nwp: x[BatchKey.nwp]}).batch(4)
+    )
+
+    batch = next(iter(dp))
+    samples = unstack_np_batch_into_examples(batch)
+    assert len(samples) == 4
+
+    for i, sample in enumerate(samples):
+        assert sample[BatchKey.nwp]["ecmwf"][NWPBatchKey.nwp][0, 0, 0, 0] == i
+        assert sample[BatchKey.nwp]["ukv"][NWPBatchKey.nwp_channel_names] == ["a", "b"]
+
+
+def test_stack_only_large_keys_on_thread_pool(monkeypatch):
+    stacked_on_pool = []
+
+    class RecordingPool:
+        def submit(self, fn, data_list, batch_key, buffer_key):
+            stacked_on_pool.append(buffer_key)
+            future = futures.Future()
+            future.set_result(fn(data_list, batch_key, buffer_key))
+            return future
+
+    monkeypatch.setattr(merge_numpy_examples_to_batch, "_get_stack_pool", RecordingPool)
+    samples = [_single_batch_sample(i) for i in range(4)]
+
+    # Only the satellite data and UKV data are this big
+    monkeypatch.setattr(merge_numpy_examples_to_batch, "_MIN_BYTES_TO_STACK_IN_PARALLEL", 200_000)
+    batch = stack_np_examples_into_batch(samples)
+    assert stacked_on_pool == [(None, BatchKey.satellite_actual), ("ukv", NWPBatchKey.nwp)]
+    assert batch[BatchKey.satellite_actual].shape == (4, 12, 10, 24, 24)
+    assert batch[BatchKey.nwp]["ukv"][NWPBatchKey.nwp].shape == (4, 8, 2, 24, 24)
+    assert batch[BatchKey.gsp_id].shape == (4, 1)
+
+    # A single large key is not worth handing to the pool
+    stacked_on_pool.clear()
+    monkeypatch.setattr(merge_numpy_examples_to_batch, "_MIN_BYTES_TO_STACK_IN_PARALLEL", 1_000_000)
+    stack_np_examples_into_batch(samples)
+    assert stacked_on_pool == []
@@ -15,6 +15,13 @@ def test_load_nwp():
         )
 
 
+def test_load_nwp_without_dask():
+    nwp_datapipe = OpenNWP(zarr_path="tests/data/nwp_data/test.zarr", chunks=None)
+    nwp = next(iter(nwp_datapipe))
+    assert nwp.chunks is None
+    assert nwp.isel(init_time_utc=0, step=0).values.ndim == 3
+
+
 def test_load_icon_eu():
     nwp_datapipe = OpenNWP(
         zarr_path="tests/data/icon_eu.zarr",
@@ -1,12 +1,15 @@
 from datetime import datetime
 
+import numpy as np
 from freezegun import freeze_time
 from torch.utils.data.datapipes.iter import IterableWrapper
 
+from ocf_datapipes.batch import BatchKey
 from ocf_datapipes.training.pvnet import (
     construct_sliced_data_pipeline,
 )
 from ocf_datapipes.utils import Location
+from ocf_datapipes.utils.utils import datetime64_to_float
 import pytest
 
 
@@ -47,6 +50,42 @@ def test_construct_sliced_data_pipeline(configuration_filename, gsp_yields):
     batch = next(iter(dp))
 
 
+@freeze_time("2020-04-01 02:30:00")
+def test_construct_sliced_data_pipeline_steady_state(configuration_filename, gsp_yields):
+    # Two samples at the same GSP location, so the second is made by an already warmed up pipeline
+    loc_pipe = IterableWrapper([Location(x=246699.328125, y=849771.9375, id=18)] * 2)
+
+    t0_pipe = IterableWrapper([datetime(2020, 4, 1, 13, 0), datetime(2020, 4, 1, 13, 30)])
+
+    dp = construct_sliced_data_pipeline(
+        configuration_filename,
+        location_pipe=loc_pipe,
+        t0_datapipe=t0_pipe,
+        production=True,
+    )
+    dp_iter = iter(dp)
+
+    # The first sample also includes the cost of opening all the data sources
+    first_batch = next(dp_iter)
+
+    batch = next(dp_iter)
+    assert batch.keys() == first_batch.keys()
+
+    # The second batch must be sliced around its own t0, not reuse data from the first
+    for sample_batch, t0 in [
+        (first_batch, datetime(2020, 4, 1, 13, 0)),
+        (batch, datetime(2020, 4, 1, 13, 30)),
+    ]:
+        gsp_t0 = sample_batch[BatchKey.gsp_time_utc][sample_batch[BatchKey.gsp_t0_idx]]
+        assert gsp_t0 == datetime64_to_float(np.datetime64(t0))
+    np.testing.assert_array_equal(
+        batch[BatchKey.gsp_time_utc], first_batch[BatchKey.gsp_time_utc] + 30 * 60
+    )
+    assert not np.array_equal(
+        batch[BatchKey.gsp_solar_elevation], first_batch[BatchKey.gsp_solar_elevation]
+    )
+
+
 @freeze_time("2020-04-01 02:30:00")
 def test_construct_sliced_data_pipeline_satellite_with_nans(configuration_filename, gsp_yields):
     # This is randomly chosen, but real, GSP location
@@ -2,6 +2,7 @@ from datetime import timedelta
 from torch.utils.data.datapipes.iter import IterableWrapper
 import pandas as pd
 import numpy as np
+import xarray as xr
 
 from ocf_datapipes.select import DrawDropoutTime, ApplyDropoutTime
 
@@ -44,3 +45,22 @@ def test_apply_dropout_time(sat_datapipe):
     # Only the last element of the slice should be nan
     for sat_im in dropout_out_sat:
         assert (np.isnan(sat_im.values).squeeze() == np.array([False, False, True])).all()
+
+
+def test_apply_dropout_time_dtype():
+    times = pd.date_range("2020-01-01 12:00", periods=3, freq="5min")
+    data = xr.DataArray(np.arange(3, dtype=np.int16), dims=["time_utc"], coords={"time_utc": times})
+
+    dropout_out = ApplyDropoutTime(
+        source_datapipe=IterableWrapper([data, data]),
+        dropout_time_datapipe=IterableWrapper([times[-1], times[1]]),
+    )
+    not_masked, masked = [*dropout_out]
+
+    # Data is unchanged if no times are after the dropout time
+    assert not_masked.dtype == np.int16
+    assert (not_masked.values == data.values).all()
+
+    # Integer data is promoted to float32 to hold the NaNs
+    assert masked.dtype == np.float32
+    assert (np.isnan(masked.values) == np.array([False, False, True])).all()
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from ocf_datapipes.select import FilterPVSystemsOnCapacity
+
+
+def _pv_data_array():
+    time = pd.date_range(start="2022-01-01", periods=4, freq="5min")
+    pv_system_id = [1, 2, 3, 4, 5]
+    return xr.DataArray(
+        np.arange(len(time) * len(pv_system_id), dtype=np.float32).reshape(4, 5),
+        dims=("time_utc", "pv_system_id"),
+        coords={
+            "time_utc": time,
+            "pv_system_id": pv_system_id,
+            "observed_capacity_wp": ("pv_system_id", [500.0, 1_000.0, 2_500.0, 4_000.0, 10_000.0]),
+        },
+    )
+
+
+def test_filter_pv_systems_on_capacity():
+    data_array = _pv_data_array()
+    datapipe = FilterPVSystemsOnCapacity(
+        [data_array], min_capacity_watts=1_000, max_capacity_watts=4_000
+    )
+    filtered = next(iter(datapipe))
+
+    # The thresholds are inclusive
+    np.testing.assert_array_equal(filtered.pv_system_id.values, [2, 3, 4])
+    xr.testing.assert_identical(filtered, data_array.sel(pv_system_id=[2, 3, 4]))
+
+
+def test_filter_pv_systems_on_capacity_defaults():
+    data_array = _pv_data_array()
+    filtered = next(iter(FilterPVSystemsOnCapacity([data_array])))
+    xr.testing.assert_identical(filtered, data_array)
+
+    filtered = next(iter(FilterPVSystemsOnCapacity([data_array], min_capacity_watts=5_000)))
+    np.testing.assert_array_equal(filtered.pv_system_id.values, [5])
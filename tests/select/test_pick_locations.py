@@ -1,8 +1,10 @@
 from datetime import timedelta
+from types import SimpleNamespace
 
 import numpy as np
 
 import ocf_datapipes  # noqa
+import ocf_datapipes.select.pick_locations as pick_locations
 from ocf_datapipes.config.model import Configuration
 from ocf_datapipes.load import OpenConfiguration, OpenPVFromNetCDF
 from ocf_datapipes.select import PickLocations
@@ -49,3 +51,31 @@ def test_pick_locations_with_id(configuration_with_pv_netcdf):
     data = next(iter(location_datapipe))
 
     assert data.id is not None
+
+
+def _first_locations(location_datapipe, n=20):
+    loc_iterator = iter(location_datapipe)
+    return [(loc.x, loc.y) for loc in (next(loc_iterator) for _ in range(n))]
+
+
+def test_pick_locations_seed(gsp_datapipe):
+    for return_all in [False, True]:
+        locations = [
+            _first_locations(
+                PickLocations(gsp_datapipe, return_all=return_all, shuffle=True, seed=seed), n=10
+            )
+            for seed in [1, 1, 2]
+        ]
+        assert locations[0] == locations[1]
+        assert locations[0] != locations[2]
+
+
+def test_pick_locations_differ_between_workers(gsp_datapipe, monkeypatch):
+    def locations_in_worker(worker_id, seed):
+        worker_info = SimpleNamespace(id=worker_id, seed=1000 + worker_id)
+        monkeypatch.setattr(pick_locations, "get_worker_info", lambda: worker_info)
+        return _first_locations(PickLocations(gsp_datapipe, seed=seed))
+
+    for seed in [None, 1]:
+        assert locations_in_worker(0, seed) != locations_in_worker(1, seed)
+        assert locations_in_worker(0, seed) == locations_in_worker(0, seed)
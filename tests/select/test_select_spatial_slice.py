@@ -8,7 +8,11 @@ from ocf_datapipes.select import (
     SelectSpatialSlicePixels,
 )
 
-from ocf_datapipes.select.select_spatial_slice import slice_spatial_pixel_window_from_xarray
+from ocf_datapipes.select.select_spatial_slice import (
+    select_spatial_slice_meters,
+    select_spatial_slices_meters,
+    slice_spatial_pixel_window_from_xarray,
+)
 
 
 def test_slice_spatial_pixel_window_from_xarray_function():
@@ -87,6 +91,46 @@ def test_select_spatial_slice_meters_passiv(passiv_datapipe):
     assert len(data.pv_system_id) == 1
 
 
+def test_select_spatial_slices_meters():
+    # Create dummy data on IDs scattered around OSGB space
+    n_ids = 50
+    rng = np.random.default_rng(0)
+    x_osgb = rng.uniform(100_000, 600_000, n_ids).astype(np.float32)
+    y_osgb = rng.uniform(100_000, 900_000, n_ids).astype(np.float32)
+
+    xr_data = xr.DataArray(
+        rng.normal(size=n_ids),
+        dims=["gsp_id"],
+        coords=dict(
+            gsp_id=np.arange(n_ids),
+            x_osgb=("gsp_id", x_osgb),
+            y_osgb=("gsp_id", y_osgb),
+        ),
+    )
+
+    locations = [Location(x=x, y=y, id=i) for i, (x, y) in enumerate(zip(x_osgb, y_osgb))]
+
+    for roi_meters in [1, 200_000]:
+        selected = select_spatial_slices_meters(
+            xr_data,
+            locations,
+            roi_width_meters=roi_meters,
+            roi_height_meters=roi_meters,
+            dim_name="gsp_id",
+        )
+        assert len(selected) == n_ids
+        for location, selected_slice in zip(locations, selected):
+            expected = select_spatial_slice_meters(
+                xr_data,
+                location,
+                roi_width_meters=roi_meters,
+                roi_height_meters=roi_meters,
+                dim_name="gsp_id",
+            )
+            xr.testing.assert_identical(selected_slice, expected)
+            assert location.id in selected_slice.gsp_id
+
+
 def test_select_spatial_slice_pixels_hrv(passiv_datapipe, sat_hrv_datapipe):
     loc_datapipe = PickLocations(passiv_datapipe)
     sat_hrv_datapipe = SelectSpatialSlicePixels(
@@ -1,8 +1,14 @@
+import numpy as np
+import xarray as xr
+
 from ocf_datapipes.select import FilterGSPIDs, PickLocations
-from ocf_datapipes.transform.xarray import CreatePVImage
 from ocf_datapipes.training.metnet.metnet_preprocessor import (
     PreProcessMetNetIterDataPipe as PreProcessMetNet,
 )
+from ocf_datapipes.training.metnet.metnet_preprocessor import (
+    _resample_to_pixel_size,
+)
+from ocf_datapipes.transform.xarray import CreatePVImage
 
 
 def test_metnet_preprocess_no_sun(sat_datapipe, gsp_datapipe):
@@ -159,3 +165,16 @@ def test_metnet_preprocess_sat_hrv_pv_nwp_topo(
     )
     data = next(iter(datapipe))
     assert data.shape == (289, 16, 100, 100)
+
+
+def test_resample_to_pixel_size_regular_grid():
+    topo = xr.DataArray(
+        np.random.default_rng(0).random((50, 40)),
+        dims=("y_osgb", "x_osgb"),
+        coords={"y_osgb": 5_000 - np.arange(50) * 100.0, "x_osgb": np.arange(40) * 100.0},
+    )
+    resampled = _resample_to_pixel_size(topo, height_pixels=24, width_pixels=16)
+    expected = topo.interp(
+        x_osgb=np.linspace(0, 3_900, 16), y_osgb=np.linspace(5_000, 100, 24), method="linear"
+    )
+    xr.testing.assert_allclose(resampled, expected)
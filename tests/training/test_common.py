@@ -1,15 +1,19 @@
 from datetime import datetime
 import numpy as np
+import pandas as pd
 import pytest
+import xarray as xr
 
 from torch.utils.data.datapipes.datapipe import IterDataPipe
-from torch.utils.data.datapipes.iter import Zipper
+from torch.utils.data.datapipes.iter import IterableWrapper, Zipper
 from torch.utils.data import DataLoader
 
 from ocf_datapipes.config.model import Configuration
 from ocf_datapipes.utils import Location
 from ocf_datapipes.training.common import (
+    DatapipeKeyForker,
     add_selected_time_slices_from_datapipes,
+    concat_xr_time_utc,
     get_and_return_overlapping_time_periods_and_t0,
     open_and_return_datapipes,
     create_t0_and_loc_datapipes,
@@ -42,6 +46,40 @@ def test_get_and_return_overlapping_time_periods_and_t0(configuration_filename):
         assert isinstance(used_datapipes[key], IterDataPipe)
 
 
+def test_datapipe_key_forker():
+    get_datapipe = DatapipeKeyForker({"a", "b"}, IterableWrapper(range(5)))
+
+    forks = [get_datapipe("a"), get_datapipe(None), get_datapipe("b")]
+
+    with pytest.raises(ValueError):
+        get_datapipe(None)
+
+    get_datapipe.close()
+
+    assert list(Zipper(*forks)) == [(i, i, i) for i in range(5)]
+
+
+def test_concat_xr_time_utc():
+    times = pd.date_range("2020-01-01 12:00", periods=6, freq="30min")
+    gsp_ids = np.arange(3)
+
+    da = xr.DataArray(
+        np.random.rand(6, 3).astype(np.float32),
+        dims=["time_utc", "gsp_id"],
+        coords=dict(
+            time_utc=times,
+            gsp_id=gsp_ids,
+            x_osgb=("gsp_id", np.random.rand(3)),
+            nominal_capacity_mwp=(("time_utc", "gsp_id"), np.random.rand(6, 3)),
+        ),
+        attrs=dict(t0_idx=2),
+    )
+
+    da_concat = concat_xr_time_utc([da.isel(time_utc=slice(0, 3)), da.isel(time_utc=slice(3, 6))])
+
+    xr.testing.assert_identical(da_concat, da)
+
+
 def test_add_selected_time_slices_from_datapipes(configuration_filename):
     used_datapipes = open_and_return_datapipes(configuration_filename)
     used_datapipes = get_and_return_overlapping_time_periods_and_t0(used_datapipes)
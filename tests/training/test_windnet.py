@@ -72,3 +72,32 @@ def test_windnet_datapipe_nwp_channels(configuration_filename):
         nwp_channels={"ukv": ["t"]},
     )
     datasets = next(iter(dp))
+
+
+def test_windnet_netcdf_datapipe_threaded(configuration_filename):
+    start_time = datetime(1900, 1, 1)
+    end_time = datetime(2050, 1, 1)
+    dp = windnet_datapipe(
+        configuration_filename,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    datasets = next(iter(dp))
+    datasets.to_netcdf("test.nc", mode="w", engine="h5netcdf", compute=True)
+
+    batches = []
+    for max_workers in [1, 4]:
+        dp = windnet_netcdf_datapipe(
+            filenames=["test.nc"],
+            keys=["nwp", "sat", "wind"],
+            max_workers=max_workers,
+        )
+        dp_iter = iter(dp)
+        batches.append([next(dp_iter) for _ in range(3)])
+
+    # Converting the samples in threads should give the same batches in the same order
+    for serial_batch, threaded_batch in zip(*batches):
+        assert serial_batch.keys() == threaded_batch.keys()
+        for key, value in serial_batch.items():
+            if isinstance(value, np.ndarray):
+                np.testing.assert_array_equal(value, threaded_batch[key])
@@ -1,3 +1,7 @@
+import numpy as np
+import xarray as xr
+from torch.utils.data.datapipes.iter import IterableWrapper
+
 from ocf_datapipes.transform.xarray import Downsample
 
 
@@ -26,3 +30,22 @@ def test_topo_downsample(topo_datapipe):
     topo_datapipe = Downsample(topo_datapipe, y_coarsen=16, x_coarsen=16)
     data = next(iter(topo_datapipe))
     assert data.shape == (176, 272)
+
+
+def test_downsample_nans():
+    data = np.arange(4 * 6, dtype=np.float32).reshape(4, 6)
+    da = xr.DataArray(
+        data,
+        dims=["y_osgb", "x_osgb"],
+        coords=dict(y_osgb=np.arange(4), x_osgb=np.arange(6)),
+    )
+    da_nan = da.copy()
+    da_nan[0, 0] = np.nan
+
+    for xr_data in [da, da_nan]:
+        downsampled = next(iter(Downsample(IterableWrapper([xr_data]), y_coarsen=2, x_coarsen=4)))
+        expected = xr_data.coarsen(y_osgb=2, x_osgb=4, boundary="trim").mean()
+        xr.testing.assert_identical(downsampled, expected)
+
+    # NaNs are skipped in the mean
+    assert not np.isnan(downsampled.values).any()
@@ -24,6 +24,14 @@ def test_normalize_nwp(nwp_datapipe):
     assert np.all(data.values >= -10.0)
 
 
+def test_normalize_out_dtype(nwp_datapipe):
+    normed_nwp_datapipe = Normalize(
+        nwp_datapipe, mean=NWP_MEANS["ukv"], std=NWP_STDS["ukv"], out_dtype=np.float16
+    )
+    data = next(iter(normed_nwp_datapipe))
+    assert data.dtype == np.float16
+
+
 def test_normalize_topo(topo_datapipe):
     normed_topo_datapipe = topo_datapipe.reproject_topography().normalize(
         calculate_mean_std_from_example=True
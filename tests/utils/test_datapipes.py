@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+from torch.utils.data.datapipes.iter import IterableWrapper
+
+from ocf_datapipes.utils import Prefetcher
+from ocf_datapipes.utils.future import ThreadPoolMapperIterDataPipe as ThreadPoolMapper
+
+
+def test_prefetcher():
+    dp = Prefetcher(IterableWrapper(range(20)), buffer_size=3)
+    assert list(dp) == list(range(20))
+    # Can be iterated again
+    assert list(dp) == list(range(20))
+
+
+def test_prefetcher_early_stop():
+    dp = Prefetcher(IterableWrapper(range(20)), buffer_size=3)
+    for i, x in enumerate(dp):
+        if i == 5:
+            break
+    assert x == 5
+
+
+def test_prefetcher_raises_source_error():
+    def fail(x):
+        if x == 3:
+            raise ValueError("Bad element")
+        return x
+
+    dp = Prefetcher(IterableWrapper(range(5)).map(fail), buffer_size=2)
+    dp_iter = iter(dp)
+    assert [next(dp_iter) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError, match="Bad element"):
+        next(dp_iter)
+
+
+def test_threadpool_mapper():
+    dp = ThreadPoolMapper(IterableWrapper(range(20)), lambda x: x * 2, max_workers=4)
+    assert list(dp) == [x * 2 for x in range(20)]
+
+
+def test_threadpool_mapper_uses_threads():
+    # Each call waits for another to start, so this would deadlock if the calls ran one at a time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_pair(x):
+        barrier.wait()
+        return x
+
+    dp = ThreadPoolMapper(IterableWrapper(range(4)), wait_for_pair, max_workers=2)
+    assert list(dp) == list(range(4))
+
+
+def test_threadpool_mapper_raises_fn_error():
+    def fail(x):
+        if x == 3:
+            raise ValueError("Bad element")
+        return x
+
+    dp_iter = iter(ThreadPoolMapper(IterableWrapper(range(5)), fail, scheduled_tasks=1))
+    assert [next(dp_iter) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError, match="Bad element"):
+        next(dp_iter)